@@ -1,6 +1,21 @@
 import matplotlib.ticker
 import spiceypy
 import numpy as np
+import warnings
+
+# Tick spacing by time span per cm of figure width: the first row whose
+# threshold is exceeded gives the major and minor tick steps (seconds) and
+# the SPICE label format.  A major step of None means monthly ticks.
+_TICK_LADDER = [
+	(16*86400, None, None, None),
+	(5*86400, 5*86400, 86400, 'DOY'),  # Every 5 days, minor ticks every day
+	(2*86400, 4*86400, 12*3600, 'DOY'),  # Every 4 days, minor ticks every 12 hours
+	(86400, 2*86400, 12*3600, 'DOY'),  # Every 2 days, minor ticks every 12 hours
+	(21600, 86400, 10800, 'DOY'),  # Every 24 hours, minor ticks every 3 hours
+	(3600, 3*3600, 1800, 'DOY HR:MN'),  # Every 3 hours, minor ticks every 30 minutes
+	(1800, 3600, 600, 'DOY HR:MN'),  # Every hour, minor ticks every 10 minutes
+	(float('-inf'), 600, 6, 'HR:MN'),  # Every 10 minutes
+]
 
 class TimeSeriesTicks:
 	def __init__(self, start_time, end_time, labels, fig):
@@ -15,52 +30,16 @@ class TimeSeriesTicks:
 		self._tick_labels = None
 		self._minor_locator = None
 
-		if self._sec_per_cm>(16*86400):
-			# monthly ticks
+		for threshold, major, minor, fmt in _TICK_LADDER:
+			if self._sec_per_cm>threshold:
+				break
+		if major is None:
 			warnings.warn('Monthly ticks not yet implemented')
-			pass
-		elif self._sec_per_cm>(5*86400):
-			# Ticks every 5 days, minor ticks every day
-			tick_start_time = self.round_up_day(self._start_time)
-			self._ticks = np.arange(tick_start_time,self._end_time,5*86400)
-			self._tick_labels = [spiceypy.timout(t,'DOY') for t in self._ticks]
-			self._minor_locator = matplotlib.ticker.MultipleLocator(86400)
-		elif self._sec_per_cm>(2*86400):
-			# Ticks every 4 days, minor ticks every 12 hours
-			tick_start_time = self.round_up_day(self._start_time)
-			self._ticks = np.arange(tick_start_time,self._end_time,4*86400)
-			self._tick_labels = [spiceypy.timout(t,'DOY') for t in self._ticks]
-			self._minor_locator = matplotlib.ticker.MultipleLocator(12*3600)
-		elif self._sec_per_cm>86400:
-			# Ticks every 2 days, minor ticks every 12 hours
-			tick_start_time = self.round_up_day(self._start_time)
-			self._ticks = np.arange(tick_start_time,self._end_time,2*86400)
-			self._tick_labels = [spiceypy.timout(t,'DOY') for t in self._ticks]
-			self._minor_locator = matplotlib.ticker.MultipleLocator(12*3600)
-		elif self._sec_per_cm>21600:
-			# Ticks every 24 hours, minor ticks every 3 hours
-			tick_start_time = self.round_up_day(self._start_time)
-			self._ticks = np.arange(tick_start_time,self._end_time,86400)
-			self._tick_labels = [spiceypy.timout(t,'DOY') for t in self._ticks]
-			self._minor_locator = matplotlib.ticker.MultipleLocator(10800)
-		elif self._sec_per_cm>3600:
-			# Ticks every 3 hours, minor ticks every 30 minutes
-			tick_start_time = self.round_up_day(self._start_time)
-			self._ticks = np.arange(tick_start_time,self._end_time,3*3600)
-			self._tick_labels = [spiceypy.timout(t,'DOY HR:MN') for t in self._ticks]
-			self._minor_locator = matplotlib.ticker.MultipleLocator(1800)
-		elif self._sec_per_cm>1800:
-			# Ticks every hour, minor ticks every 10 minutes
-			tick_start_time = self.round_up_day(self._start_time)
-			self._ticks = np.arange(tick_start_time,self._end_time,3600)
-			self._tick_labels = [spiceypy.timout(t,'DOY HR:MN') for t in self._ticks]
-			self._minor_locator = matplotlib.ticker.MultipleLocator(600)
 		else:
-			# Ticks every 10 minutes
 			tick_start_time = self.round_up_day(self._start_time)
-			self._ticks = np.arange(tick_start_time,self._end_time,600)
-			self._tick_labels = [spiceypy.timout(t,'HR:MN') for t in self._ticks]
-			self._minor_locator = matplotlib.ticker.MultipleLocator(6)
+			self._ticks = np.arange(tick_start_time,self._end_time,major)
+			self._tick_labels = list(spiceypy.timout(self._ticks,fmt))
+			self._minor_locator = matplotlib.ticker.MultipleLocator(minor)
 
 	def round_up_day(self, t):
 		# Take a timestamp and round it up to the nearest day and return
@@ -69,11 +48,14 @@ class TimeSeriesTicks:
 		return spiceypy.str2et('JD '+jd_str)+0.1
 
 	def set_x(self):
-		for l in self._panel_labels:
-			self._fig[l].ax.set_xlim([self._start_time,self._end_time])
-			self._fig[l].ax.set_xticks(self._ticks)
-			if l==self._panel_bottom:
-				self._fig[l].ax.set_xticklabels(self._tick_labels)
-			else:
-				self._fig[l].ax.set_xticklabels([])
-			self._fig[l].ax.xaxis.set_minor_locator(self._minor_locator)
+		# Every panel shares the limits, ticks and minor locator; only the
+		# bottom panel is labelled.
+		bottom = self._fig[self._panel_bottom].axes
+		others = [self._fig[l].axes for l in self._panel_labels if l!=self._panel_bottom]
+		for ax in others+[bottom]:
+			ax.set_xlim([self._start_time,self._end_time])
+			ax.set_xticks(self._ticks)
+			ax.xaxis.set_minor_locator(self._minor_locator)
+		for ax in others:
+			ax.set_xticklabels([])
+		bottom.set_xticklabels(self._tick_labels)
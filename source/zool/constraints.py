@@ -1,12 +1,39 @@
 """Constraints and constraint serialisers/deserialisers
 """
+import weakref
 from dataclasses import dataclass
 from typing import Union
 
 from .exceptions import DeserialisationError
 
 
-@dataclass
+# Deserialised constraints with the same class and value share one instance.
+_INTERNED = weakref.WeakValueDictionary()
+
+
+def _interned(cls: type, value):
+    """Return the shared instance of a valued constraint.
+
+    Parameters
+    ----------
+    cls : type
+        Constraint class, e.g., Fixed.
+    value
+        The constraint's value.
+
+    Returns
+    -------
+    Union[Fixed,FixedAspect,Named]
+    """
+    key = (cls, value)
+    constraint = _INTERNED.get(key)
+    if constraint is None:
+        constraint = cls(value)
+        _INTERNED[key] = constraint
+    return constraint
+
+
+@dataclass(frozen=True)
 class Fixed:
     """Constraint for a fixed width or height size.
 
@@ -16,19 +43,58 @@ class Fixed:
         The width or height for this fixed constraint.
     """
 
+    __slots__ = ("size", "_serialised", "__weakref__")
+
     size: float
 
+    def __reduce__(self):
+        return (type(self), (self.size,))
+
+    @classmethod
+    def from_dict(cls, v: dict) -> "Fixed":
+        """Create this constraint from its serialised dictionary.
+
+        Parameters
+        ----------
+        v : dict
+            Serialised constraint.
+
+        Returns
+        -------
+        Fixed
+
+        Raises
+        ------
+        DeserialisationError
+            If the dictionary has no <size> entry.
+        """
+        try:
+            size = v["size"]
+        except KeyError:
+            raise DeserialisationError(
+                "Fixed", "Require a value for a fixed constraint"
+            ) from None
+        return _interned(cls, size if type(size) is float else float(size))
+
     def to_dict(self) -> dict:
         """Convert this constraint into a dictionary
 
+        The dictionary is built on the first call and then reused, so it
+        should be treated as read-only.
+
         Returns
         -------
         dict
         """
-        return {"constraint": "fixed", "size": self.size}
+        try:
+            return self._serialised
+        except AttributeError:
+            d = {"constraint": "fixed", "size": self.size}
+            object.__setattr__(self, "_serialised", d)
+            return d
 
 
-@dataclass
+@dataclass(frozen=True)
 class FixedAspect:
     """Constraint with a fixed aspect ratio.
 
@@ -38,58 +104,153 @@ class FixedAspect:
         Aspect ratio (width/height) for this fixed constraint.
     """
 
+    __slots__ = ("aspect", "_serialised", "__weakref__")
+
     aspect: float
 
+    def __reduce__(self):
+        return (type(self), (self.aspect,))
+
+    @classmethod
+    def from_dict(cls, v: dict) -> "FixedAspect":
+        """Create this constraint from its serialised dictionary.
+
+        Parameters
+        ----------
+        v : dict
+            Serialised constraint.
+
+        Returns
+        -------
+        FixedAspect
+
+        Raises
+        ------
+        DeserialisationError
+            If the dictionary has no <aspect> entry.
+        """
+        try:
+            aspect = v["aspect"]
+        except KeyError:
+            raise DeserialisationError(
+                "FixedAspect", "Require a value for a fixedAspect constraint"
+            ) from None
+        return _interned(
+            cls, aspect if type(aspect) is float else float(aspect)
+        )
+
     def to_dict(self) -> dict:
         """Convert this constraint into a dictionary
 
+        The dictionary is built on the first call and then reused, so it
+        should be treated as read-only.
+
         Returns
         -------
         dict
         """
-        return {"constraint": "fixedAspect", "aspect": self.aspect}
+        try:
+            return self._serialised
+        except AttributeError:
+            d = {"constraint": "fixedAspect", "aspect": self.aspect}
+            object.__setattr__(self, "_serialised", d)
+            return d
+
+
+# Serialised forms of the stateless constraints. These are shared by every
+# call to to_dict and must not be modified.
+_FROM_CHILDREN_DICT = {"constraint": "fromChildren"}
+_FROM_PARENT_DICT = {"constraint": "fromParent"}
+_FILL_DICT = {"constraint": "fill"}
+
+
+class _Stateless:
+    """Base class for constraints that carry no state.
+
+    These are singletons: every call such as ``Fill()`` returns the same
+    instance, so they can be compared by identity and are never reallocated.
+    """
+
+    __slots__ = ()
+    _instance = None
 
+    def __new__(cls):
+        if cls.__dict__.get("_instance") is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
-class FromChildren:
+    @classmethod
+    def from_dict(cls, v: dict) -> "_Stateless":
+        """Create this constraint from its serialised dictionary.
+
+        Parameters
+        ----------
+        v : dict
+            Serialised constraint.
+
+        Returns
+        -------
+        _Stateless
+            The shared instance of this constraint.
+        """
+        return cls()
+
+
+class FromChildren(_Stateless):
     """Constraint where the width or height comes from any child elements."""
 
+    __slots__ = ()
+
     def to_dict(self) -> dict:
         """Convert this constraint into a dictionary
 
+        The same dictionary is returned on every call so it should be
+        treated as read-only.
+
         Returns
         -------
         dict
         """
-        return {"constraint": "fromChildren"}
+        return _FROM_CHILDREN_DICT
 
 
-class FromParent:
+class FromParent(_Stateless):
     """Constraint where a width or height comes from the parent element."""
 
+    __slots__ = ()
+
     def to_dict(self) -> dict:
         """Convert this constraint into a dictionary
 
+        The same dictionary is returned on every call so it should be
+        treated as read-only.
+
         Returns
         -------
         dict
         """
-        return {"constraint": "fromParent"}
+        return _FROM_PARENT_DICT
 
 
-class Fill:
+class Fill(_Stateless):
     """Constraint where width or height set to fill parent element."""
 
+    __slots__ = ()
+
     def to_dict(self) -> dict:
         """Convert this constraint into a dictionary
 
+        The same dictionary is returned on every call so it should be
+        treated as read-only.
+
         Returns
         -------
         dict
         """
-        return {"constraint": "fill"}
+        return _FILL_DICT
 
 
-@dataclass
+@dataclass(frozen=True)
 class Named:
     """Constraint where width or height comes from another element.
 
@@ -99,16 +260,70 @@ class Named:
         Id string to point to the element.
     """
 
+    __slots__ = ("id", "_serialised", "__weakref__")
+
     id: str
 
+    def __reduce__(self):
+        return (type(self), (self.id,))
+
+    @classmethod
+    def from_dict(cls, v: dict) -> "Named":
+        """Create this constraint from its serialised dictionary.
+
+        Parameters
+        ----------
+        v : dict
+            Serialised constraint.
+
+        Returns
+        -------
+        Named
+
+        Raises
+        ------
+        DeserialisationError
+            If the dictionary has no <id> entry.
+        """
+        try:
+            id = v["id"]
+        except KeyError:
+            raise DeserialisationError(
+                "Named",
+                "Require a panel id for a named width/height constraint",
+            ) from None
+        return _interned(cls, id)
+
     def to_dict(self) -> dict:
         """Convert this constraint into a dictionary
 
+        The dictionary is built on the first call and then reused, so it
+        should be treated as read-only.
+
         Returns
         -------
         dict
         """
-        return {"constraint": "named", "id": self.id}
+        try:
+            return self._serialised
+        except AttributeError:
+            d = {"constraint": "named", "id": self.id}
+            object.__setattr__(self, "_serialised", d)
+            return d
+
+
+# Marks an absent dictionary entry, since None may be a (bad) stored value.
+_MISSING = object()
+
+# Constructors for each serialised constraint, keyed by the <constraint> entry.
+_DESERIALISERS = {
+    "fixed": Fixed.from_dict,
+    "fixedAspect": FixedAspect.from_dict,
+    "named": Named.from_dict,
+    "fill": Fill.from_dict,
+    "fromChildren": FromChildren.from_dict,
+    "fromParent": FromParent.from_dict,
+}
 
 
 def constraint_deserialiser(
@@ -136,44 +351,20 @@ def constraint_deserialiser(
 
     if not isinstance(v, dict):
         raise TypeError("Supplied variable is not a dictionary")
-    if "constraint" not in v:
+    tag = v.get("constraint", _MISSING)
+    if tag is _MISSING:
         raise DeserialisationError(
             "Unknown", "Supplied dictionary does not have a <constraint> entry"
         )
 
-    if v["constraint"] == "fixed":
-        if "size" not in v:
-            raise DeserialisationError(
-                "Fixed", "Require a value for a fixed constraint"
-            )
-        return Fixed(float(v["size"]))
-
-    elif v["constraint"] == "fixedAspect":
-        if "aspect" not in v:
-            raise DeserialisationError(
-                "FixedAspect", "Require a value for a fixedAspect constraint"
-            )
-        return FixedAspect(float(v["aspect"]))
-
-    elif v["constraint"] == "named":
-        if "id" not in v:
-            raise DeserialisationError(
-                "Named",
-                "Require a panel id for a named width/height constraint",
-            )
-        return Named(v["id"])
-
-    elif v["constraint"] == "fill":
-        return Fill()
-
-    elif v["constraint"] == "fromChildren":
-        return FromChildren()
-
-    elif v["constraint"] == "fromParent":
-        return FromParent()
-
-    else:
+    try:
+        builder = _DESERIALISERS.get(tag)
+    except TypeError:
+        # An unhashable tag, e.g., a list, can't be a known constraint.
+        builder = None
+    if builder is None:
         raise DeserialisationError(
-            v["constraint"],
-            "Unknown constraint type <{}>".format(v["constraint"]),
+            tag,
+            "Unknown constraint type <{}>".format(tag),
         )
+    return builder(v)
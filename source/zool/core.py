@@ -1,22 +1,42 @@
 """ Core definitions.
 """
 from __future__ import annotations
-from typing import Union,Tuple,Dict,Iterable,TypeVar,Type
+from typing import Union,Tuple,Dict,Iterable,TypeVar,Type,TYPE_CHECKING
 import collections
 import uuid
 import itertools
 import json
+import sys
 import warnings
 
-import matplotlib.axes
-import matplotlib.figure
-import matplotlib.pyplot as plt
-import matplotlib.colors
-import matplotlib.patches
 import kiwisolver as ks
 
-from .constraints import *
-from .exceptions import *
+from .constraints import Fixed, FixedAspect, FromChildren, FromParent, Fill, Named, constraint_deserialiser
+from .exceptions import InappropriateConstraint, NoSolution, UnknownElement, DeserialisationError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+else:
+    # Sizes and margins may be given as NumPy scalars, which the standard library
+    # accepts as floats but orjson only serialises with this option.
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+# Standard library JSON options matching orjson's compact output.
+_COMPACT_JSON = {"separators": (",", ":")}
+
+# Auto-generated element ids are a random prefix, fixed for this process,
+# followed by a running count.  This keeps them unique without calling
+# uuid.uuid4() for every element.
+_ID_PREFIX = uuid.uuid4().hex
+_id_counter = itertools.count()
+
+# Matplotlib is only imported when a figure or axes is actually needed, since
+# importing pyplot is slow and isn't needed to solve or serialise a layout.
+if TYPE_CHECKING:
+    import matplotlib.axes
+    import matplotlib.figure
 
 
 class PlotElement:
@@ -54,14 +74,31 @@ class PlotElement:
         Coordinates of the bottom edge of the element.
     _child_layout_direction : str
         In what direction are any child elements laid out?  "horizontal" or "vertical".
+    _horizontal : bool
+        True if child elements are laid out horizontally, worked out once from _child_layout_direction.
     _child_layout_padding : float
         The padding applied between any child elements.
+    _total_child_padding : float
+        The total padding between all the child elements.
     _parent : str
         String referring to the parent element id.
     _children : list(str)
         List containing id strings for the child elements.
+    _serialised : dict
+        Cached result of to_dict, None when it needs rebuilding.
+    _size_constraints : tuple
+        Cached (parent element, KiwiSolve constraints) for the element's own width and height,
+        None until a layout first builds them.
     """
 
+    # Layouts can hold many elements, so store attributes in slots rather
+    # than a per-instance dictionary.
+    __slots__ = ('_id', '_ax', '_width_constraint', '_height_constraint', '_width', '_height',
+                    '_margin_left', '_margin_right', '_margin_top', '_margin_bottom',
+                    '_x_left', '_x_right', '_y_top', '_y_bottom',
+                    '_child_layout_direction', '_horizontal', '_child_padding', '_total_child_padding', '_parent', '_children', '_serialised',
+                    '_size_constraints')
+
     def __init__(self, id: str=None, width: Union[float,Fixed,FixedAspect,FromChildren,FromParent,Fill,Named]=FromParent(),
                         height: Union[float,Fixed,FixedAspect,FromChildren,FromParent,Fill,Named]=FromParent(),
                         layout: str='vertical', padding: float=0.0,
@@ -71,7 +108,7 @@ class PlotElement:
         Parameters
         ----------
         id : str, optional
-            Id for the element, by default None in which case a random uuid.uuid4() string will be generated.
+            Id for the element, by default None in which case a unique id will be generated.
         width : Union[float,Fixed,FixedAspect,FromChildren,FromParent,Fill,Named], optional
             Width specification for the element, if it's a float then it will be assumed to be fixed, by default FromParent().
         height : Union[float,Fixed,FixedAspect,FromChildren,FromParent,Fill,Named], optional
@@ -89,7 +126,9 @@ class PlotElement:
         margin_bottom : float, optional
             Bottom margin for this element, by default 0.0
         """
-        self._id = id if id is not None else str(uuid.uuid4())
+        # Ids are dictionary keys throughout the layout, so intern them to make
+        # lookups compare by identity.
+        self._id = sys.intern(str(id) if id is not None else '{}-{}'.format(_ID_PREFIX, next(_id_counter)))
         self._ax = None
 
         # Store the width and height constraints.
@@ -128,14 +167,18 @@ class PlotElement:
         if not (layout=='horizontal' or layout=='vertical'):
             raise ValueError('Layout must be "vertical" or "horizontal"')
         self._child_layout_direction = layout
+        self._horizontal = layout=='horizontal'
 
         if not isinstance(padding,(float,int)):
             raise TypeError('Padding must be a number')
         self._child_padding = float(padding)
+        self._total_child_padding = 0.0
 
         # Parent and child element id strings.
         self._parent = None
         self._children = list()
+        self._serialised = None
+        self._size_constraints = None
 
     def append_child(self, id: str):
         """Append a child element id to the child list of this element.
@@ -152,7 +195,10 @@ class PlotElement:
         """
         if not isinstance(id, str):
             raise TypeError
-        self._children.append(id)
+        if self._children:
+            self._total_child_padding += self._child_padding
+        self._children.append(sys.intern(str(id)))
+        self._serialised = None
 
     @property
     def id(self) -> str:
@@ -169,6 +215,10 @@ class PlotElement:
     def id(self, v: str):
         """Set the id string.
 
+        The id should only be set before the element is added to a Layout.  The layout indexes
+        its elements by id and keeps its solution until more elements are added, so renaming an
+        element that is already in a layout is not seen by it.
+
         Parameters
         ----------
         v : str
@@ -181,7 +231,8 @@ class PlotElement:
         """
         if not isinstance(v, str):
             raise TypeError
-        self._id = v
+        self._id = sys.intern(str(v))
+        self._serialised = None
         self._width.setName(self._id+'-w')
         self._height.setName(self._id+'-h')
 
@@ -209,6 +260,7 @@ class PlotElement:
         TypeError
             If the provided object is not a matplotlib Axes.
         """
+        import matplotlib.axes
         if not isinstance(ax, matplotlib.axes.Axes):
             raise TypeError
         self._ax = ax
@@ -273,12 +325,14 @@ class PlotElement:
     def total_child_padding(self) -> float:
         """Return the total amount of padding required inside this element.
 
+        This is kept up to date as child elements are appended.
+
         Returns
         -------
         float
-            Total padding.
+            Total padding, zero if there are fewer than two child elements.
         """
-        return self._child_padding*(len(self._children)-1)
+        return self._total_child_padding
 
     @property
     def has_children(self) -> bool:
@@ -303,10 +357,7 @@ class PlotElement:
         bool
             True if they are laid out vertically, False if not.
         """
-        if self._child_layout_direction=="vertical":
-            return True
-        else:
-            return False
+        return not self._horizontal
 
     @property
     def is_child_layout_horizontal(self) -> bool:
@@ -317,10 +368,7 @@ class PlotElement:
         bool
             True if they are laid out horizontally, False if not.
         """
-        if self._child_layout_direction=="horizontal":
-            return True
-        else:
-            return False
+        return self._horizontal
 
     @property
     def margin_left(self) -> float:
@@ -499,37 +547,117 @@ class PlotElement:
 
     @property
     def child_iterator(self) -> Iterable[str]:
-        """Return an iterator over all the child PlotElements.
+        """Return the ids of all the child PlotElements, in order.
+
+        This is a property giving a tuple, so it can be looped over directly
+        and children can only be added through append_child.
 
         Returns
         -------
         Iterable[str]
         """
-        return self._children.__iter__
+        return tuple(self._children)
 
     def to_dict(self) -> dict:
         """Serialise this plot element to a dictionary.
 
+        The dictionary is a copy, so it can be modified without affecting this element or its
+        constraints.
+
         Returns
         -------
         dict
         """
-        d = {'widthConstraint': self._width_constraint.to_dict(),
-            'heightConstraint': self._height_constraint.to_dict(),
-            'marginLeft': self._margin_left,
-            'marginRight': self._margin_right,
-            'marginTop': self._margin_top,
-            'marginBottom': self._margin_bottom,
-            'childLayoutDirection': self._child_layout_direction, 'childPadding': self._child_padding,
-            'label': self._id, 'parentId':'' if self._parent is None else self._parent,
-            'childLabels': self._children}
-        return d
+        d = self._to_dict()
+        return dict(d, widthConstraint=dict(d['widthConstraint']),
+                    heightConstraint=dict(d['heightConstraint']),
+                    childLabels=list(d['childLabels']))
+
+    def _to_dict(self) -> dict:
+        """Serialise this plot element to a dictionary that is shared with later calls.
+
+        The dictionary is cached until the element's id or children change, and the constraint
+        dictionaries in it are shared with the constraints, so this must only be used where the
+        result is serialised straight away.
+
+        Returns
+        -------
+        dict
+        """
+        if self._serialised is None:
+            self._serialised = {'widthConstraint': self._width_constraint.to_dict(),
+                'heightConstraint': self._height_constraint.to_dict(),
+                'marginLeft': self._margin_left,
+                'marginRight': self._margin_right,
+                'marginTop': self._margin_top,
+                'marginBottom': self._margin_bottom,
+                'childLayoutDirection': self._child_layout_direction, 'childPadding': self._child_padding,
+                'label': self._id, 'parentId':'' if self._parent is None else self._parent,
+                'childLabels': list(self._children)}
+        return self._serialised
 
 
 
 _T = TypeVar("_T")
 
 
+# Rules for the constraint that sets an element's own width or height, keyed
+# by the type of its width/height constraint.  Each rule takes the layout, the
+# parent element (None for the base) and the element, and returns a KiwiSolve
+# relation.  FromChildren and Fill have no rule of their own since they are
+# set from the sums of the child/sibling elements.
+_WIDTH_RULES = {
+    Fixed: lambda layout, parent, e: e.width == e.width_constraint.size,
+    FixedAspect: lambda layout, parent, e: e.width == e.height*e.width_constraint.aspect,
+    FromParent: lambda layout, parent, e: e.width == parent.width - parent.margin_left - parent.margin_right,
+    Named: lambda layout, parent, e: e.width == layout[e.width_constraint.id].width,
+    FromChildren: None,
+    Fill: None,
+}
+
+_HEIGHT_RULES = {
+    Fixed: lambda layout, parent, e: e.height == e.height_constraint.size,
+    FixedAspect: lambda layout, parent, e: e.height == e.width/e.height_constraint.aspect,
+    FromParent: lambda layout, parent, e: e.height == parent.height - parent.margin_top - parent.margin_bottom,
+    Named: lambda layout, parent, e: e.height == layout[e.height_constraint.id].height,
+    FromChildren: None,
+    Fill: None,
+}
+
+# Constraint types whose dimension counts towards the total size of the
+# child elements; Fill elements share out whatever space remains.
+_SUMMED_CONSTRAINTS = frozenset((Fixed, FixedAspect, FromChildren, Named))
+
+# Constraint class that each constraint type is handled as, filled in for
+# subclasses of the constraints the first time they are seen.
+_CONSTRAINT_KINDS = {cls: cls for cls in _WIDTH_RULES}
+
+
+def _constraint_kind(constraint) -> Union[type,None]:
+    """Return the constraint class that a constraint is handled as.
+
+    Parameters
+    ----------
+    constraint
+        Width or height constraint.
+
+    Returns
+    -------
+    Union[type,None]
+        One of the constraint classes in _WIDTH_RULES, or None if the constraint is of an
+        unknown type.
+    """
+    cls = type(constraint)
+    try:
+        return _CONSTRAINT_KINDS[cls]
+    except KeyError:
+        pass
+    kind = next((base for base in cls.__mro__ if base in _WIDTH_RULES), None)
+    if kind is not None:
+        _CONSTRAINT_KINDS[cls] = kind
+    return kind
+
+
 class Layout:
     """Layout class
 
@@ -559,6 +687,16 @@ class Layout:
     ----------
     _elements : dict
         Contains all the elements in this plot indexed by their id labels.
+    _pending_constraints : list
+        KiwiSolve constraints collected while building one group of constraints.
+    _installed : dict
+        Groups of constraints currently in the solver, indexed by parent id (None for the
+        base size), each a tuple of a signature and a list of KiwiSolve constraints.
+    _positions : dict
+        Position of each element as a fraction of the base size, [left, bottom, width, height],
+        indexed by id and computed when the layout is solved.
+    _figure : matplotlib.figure.Figure
+        The most recent figure made by figure(), which axes() adds to, None until one is made.
     """
     def __init__(self, figwidth: Union[float,Fixed,FixedAspect,FromChildren]=FromChildren(),
                         figheight: Union[float,Fixed,FixedAspect,FromChildren]=FromChildren(),
@@ -593,6 +731,10 @@ class Layout:
         # The solver we will use to figure out the layout.
         self._solver = ks.Solver()
         self._solved = False
+        self._pending_constraints = []
+        self._installed = {}
+        self._positions = {}
+        self._figure = None
 
         # Setup base element.
         base = PlotElement(id='base', width=figwidth, height=figheight,
@@ -603,51 +745,192 @@ class Layout:
 
     def layout(self):
         """Layout the plot.
+
+        Adding elements marks the layout as unsolved.  If nothing has been
+        added since the last call then the existing solution still holds and
+        the constraints are not rebuilt.  Elements already in the layout are
+        treated as fixed: changing one, e.g., renaming it, does not mark the
+        layout as unsolved.
         """
-        self._setup_constraints()
+        if self._solved:
+            return
+
+        # The tree is walked once and the same order used to set up the
+        # constraints and then to read back the coordinates.
+        parent_ids = self._parent_ids()
+        self._setup_constraints(parent_ids)
         self._solver.updateVariables()
-        self._compute_coordinates()
+        self._compute_coordinates(parent_ids)
         self._solved = True
 
-    def _setup_constraints(self):
-        """Resets the solver and sets up all the constraints needed to layout the plot.
+    def _setup_constraints(self, parent_ids: list=None):
+        """Sets up all the constraints needed to layout the plot.
 
-        This routine calls _setup_child_constraints to process all the child elements.  I think
-        this could be optimised.
+        The constraints are kept in groups: one for the size of the base and one for the child
+        elements of each parent, built by _setup_child_constraints.  A group is only rebuilt if
+        the parent's children have changed since the last layout, and the solver is then
+        updated by removing the groups that have gone and adding the new ones, rather than
+        being reset and given every constraint again.  All the groups are built before the
+        solver is touched, so an inappropriate constraint leaves the previous solution intact.
+
+        Parameters
+        ----------
+        parent_ids : list, optional
+            Ids of the elements with children, from _parent_ids, by default worked out here.
         """
-        self._solver.reset()
         self._solved = False
 
         # Setup the base element.
-        if isinstance(self["base"].width_constraint, Fixed):
-            self._solver.addConstraint((self["base"].width == self["base"].width_constraint.size) | "required")
-        elif isinstance(self["base"].width_constraint, FromChildren):
-            pass
-        elif isinstance(self["base"].width_constraint, FixedAspect):
-            self._solver.addConstraint((self["base"].width == self["base"].height*self["base"].width_constraint.aspect) | "required")
-        elif isinstance(self["base"].width_constraint, (FromParent,Named,Fill)):
-            raise InappropriateConstraint(type(self["base"].width_constraint), "base", "Base element cannot be constrained by parent (there isn't one), another element, or fill (there's nothing to fill)")
-        else:
-            raise InappropriateConstraint(type(self["base"].width_constraint), "base", "Unknown constraint")
-
-        if isinstance(self["base"].height_constraint, Fixed):
-            self._solver.addConstraint((self["base"].height == self["base"].height_constraint.size) | "required")
-        elif isinstance(self["base"].height_constraint, FromChildren):
-            pass
-        elif isinstance(self["base"].height_constraint, FixedAspect):
-            self._solver.addConstraint((self["base"].height == self["base"].width/self["base"].height_constraint.aspect) | "required")
-        elif isinstance(self["base"].height_constraint, (FromParent,Named,Fill)):
-            raise InappropriateConstraint(type(self["base"].height_constraint), "base", "Base element cannot be constrained by parent (there isn't one), another element, or fill (there's nothing to fill)")
+        base = self["base"]
+        for constraint in (base.width_constraint, base.height_constraint):
+            if isinstance(constraint, (FromParent,Named,Fill)):
+                raise InappropriateConstraint(type(constraint), "base", "Base element cannot be constrained by parent (there isn't one), another element, or fill (there's nothing to fill)")
+        installed = self._installed
+        signature = (base,)
+        group = installed.get(None)
+        if group is None or group[0]!=signature:
+            group = self._constraint_group(None, signature)
+        groups = {None: group}
+
+        # Now process the child constraints of every parent, working down the tree.
+        for id in (self._parent_ids() if parent_ids is None else parent_ids):
+            signature = self._group_signature(id)
+            group = installed.get(id)
+            if signature is None or group is None or group[0]!=signature:
+                group = self._constraint_group(id, signature)
+            groups[id] = group
+
+        # Swap any changed groups of constraints in the solver.
+        try:
+            for key, group in installed.items():
+                if groups.get(key) is not group:
+                    for constraint in group[1]:
+                        self._solver.removeConstraint(constraint)
+            for key, group in groups.items():
+                if installed.get(key) is not group:
+                    for constraint in group[1]:
+                        self._solver.addConstraint(constraint)
+        except Exception:
+            # Don't leave the solver holding a mixture of old and new constraints.
+            self._solver.reset()
+            self._installed = {}
+            raise
+        self._installed = groups
+
+
+    def _group_signature(self, id: str) -> Union[tuple,None]:
+        """Return what the constraints for the child elements of a given id depend on.
+
+        Parameters
+        ----------
+        id : str
+            Id of the parent element.
+
+        Returns
+        -------
+        Union[tuple,None]
+            The parent and child element objects, or None if a named constraint means the
+            group must always be rebuilt (the named element may have been replaced).
+        """
+        elements = self._elements
+        parent = elements[id]
+        children = tuple(elements[k] for k in parent._children)
+        for child in children:
+            if _constraint_kind(child._width_constraint) is Named or _constraint_kind(child._height_constraint) is Named:
+                return None
+        return (parent, children)
+
+
+    def _constraint_group(self, id: Union[str,None], signature: Union[tuple,None]) -> tuple:
+        """Build the constraints for the child elements of a given id.
+
+        Parameters
+        ----------
+        id : Union[str,None]
+            Id of the parent element, or None for the size of the base itself.
+        signature : Union[tuple,None]
+            Signature of the group from _group_signature.
+
+        Returns
+        -------
+        tuple
+            The signature and a list of KiwiSolve constraints.
+        """
+        self._pending_constraints = []
+        if id is None:
+            self._add_dimension_constraints(None, self._elements["base"])
         else:
-            raise InappropriateConstraint(type(self["base"].height_constraint), "base", "Unknown constraint")
+            self._setup_child_constraints(id)
+        constraints = self._pending_constraints
+        self._pending_constraints = []
+        return (signature, constraints)
+
+
+    def _parent_ids(self) -> list:
+        """List the ids of all the elements with child elements, parents before their children.
+
+        The tree is walked with an explicit stack rather than by recursion so
+        that deep layouts don't run into Python's recursion limit.
+
+        Returns
+        -------
+        list
+            Element ids in depth-first pre-order, starting with the base.
+        """
+        elements = self._elements
+        order = []
+        stack = ["base"]
+        while stack:
+            id = stack.pop()
+            order.append(id)
+            stack.extend(k for k in reversed(elements[id]._children) if elements[k]._children)
+        return order
 
-        # Now recursively process all the child constraints.
-        self._setup_child_constraints("base")
+
+    def _add_dimension_constraints(self, parent: Union[PlotElement,None], element: PlotElement):
+        """Add the constraints that set the width and height of an element itself.
+
+        Parameters
+        ----------
+        parent : Union[PlotElement,None]
+            Parent element, None for the base.
+        element : PlotElement
+            Element to constrain.
+
+        Raises
+        ------
+        InappropriateConstraint
+            If the width or height constraint is of an unknown type.
+        """
+        # The constraints are built once and reused on later layouts of the same parent, unless
+        # they refer to a named element which may since have been replaced under the same id.
+        cached = element._size_constraints
+        if cached is not None and cached[0] is parent:
+            constraints = cached[1]
+        else:
+            constraints = []
+            reusable = True
+            for rules, constraint in ((_WIDTH_RULES, element.width_constraint),
+                                        (_HEIGHT_RULES, element.height_constraint)):
+                kind = _constraint_kind(constraint)
+                if kind is None:
+                    raise InappropriateConstraint(type(constraint), element.id, "Unknown constraint")
+                rule = rules[kind]
+                if rule is not None:
+                    constraints.append(rule(self, parent, element) | "required")
+                if kind is Named:
+                    reusable = False
+            if reusable:
+                element._size_constraints = (parent, constraints)
+        self._pending_constraints.extend(constraints)
 
 
     def _setup_child_constraints(self, id: str):
         """Sets up all the constraints for a set of child elements needed to layout the plot.
 
+        Only the direct children of id are processed; _setup_constraints calls
+        this for every parent element in turn.
+
         Parameters
         ----------
         id : str
@@ -659,104 +942,114 @@ class Layout:
             If the id is not known.
         """
 
-        if id not in self._elements:
+        elements = self._elements
+        if id not in elements:
             raise UnknownElement(id)
+        parent = elements[id]
 
         # If we are laying out vertically then we sum up the height
         # of all the child elements, if horizontally then we sum
         # the width of all our child elements, plus any padding.
-        if self[id].is_child_layout_vertical:
-            wsum = self[id].margin_left + self[id].margin_right
-            hsum = self[id].total_child_padding + self[id].margin_top + self[id].margin_bottom
-        elif self[id].is_child_layout_horizontal:
-            wsum = self[id].total_child_padding + self[id].margin_left + self[id].margin_right
-            hsum = self[id].margin_top + self[id].margin_bottom
+        if parent.is_child_layout_vertical:
+            wsum = parent.margin_left + parent.margin_right
+            hsum = parent.total_child_padding + parent.margin_top + parent.margin_bottom
+        elif parent.is_child_layout_horizontal:
+            wsum = parent.total_child_padding + parent.margin_left + parent.margin_right
+            hsum = parent.margin_top + parent.margin_bottom
         else:
             raise RuntimeError("Cannot establish the layout direction")
         hfill = []
         wfill = []
 
         # Now process the constraints of each of the child items.
-        for child_id in self[id].child_iterator():
-
-            # Set the constraints for all the child elements.
-            if isinstance(self[child_id].width_constraint, Fixed):
-                self._solver.addConstraint((self[child_id].width == self[child_id].width_constraint.size) | "required")
-            elif isinstance(self._elements["base"].width_constraint, FixedAspect):
-                self._solver.addConstraint((self[child_id].width == self[child_id].height*self[child_id].width_constraint.aspect) | "required")
-            elif isinstance(self[child_id].width_constraint, FromParent):
-                self._solver.addConstraint((self[child_id].width == self[id].width - self[id].margin_left - self[id].margin_right) | "required")
-            else:
-                pass
-
-            if isinstance(self[child_id].height_constraint, Fixed):
-                self._solver.addConstraint((self[child_id].height == self[child_id].height_constraint.size) | "required")
-            elif isinstance(self[child_id].height_constraint, FixedAspect):
-                self._solver.addConstraint((self[child_id].height == self[child_id].width/self[child_id].height_constraint.aspect) | "required")
-            elif isinstance(self[child_id].height_constraint, FromParent):
-                self._solver.addConstraint((self[child_id].height == self[id].height - self[id].margin_top - self[id].margin_bottom) | "required")
-            else:
-                pass
+        add_dimension_constraints = self._add_dimension_constraints
+        for child_id in parent._children:
+            child = elements[child_id]
 
-            # Add a constraint where an element gets its width or height from another specific node.
-            if isinstance(self[child_id].width_constraint, Named):
-                self._solver.addConstraint((self[child_id].width==self[self[child_id].width_constraint.id].width) | 'required')
-            if isinstance(self[child_id].height_constraint, Named):
-                self._solver.addConstraint((self[child_id].height==self[self[child_id].height_constraint.id].height) | 'required')
+            # Set the constraints for the size of the child element itself.
+            add_dimension_constraints(parent, child)
 
             # Form a constraint for the sum of all the child widths and all the elements that are part of the fill.
-            if isinstance(self[child_id].width_constraint, (Fixed,FixedAspect,FromChildren,Named)):
-                wsum += self[child_id].width
-            elif isinstance(self[child_id].width_constraint, Fill):
-                wfill.append(child_id)
-            else:
-                pass
+            # Fixed sizes are already known so they are added as numbers, keeping the solver expressions short.
+            width_constraint = child._width_constraint
+            width_type = _constraint_kind(width_constraint)
+            if width_type is Fixed:
+                wsum += width_constraint.size
+            elif width_type in _SUMMED_CONSTRAINTS:
+                wsum += child._width
+            elif width_type is Fill:
+                wfill.append(child)
 
             # Form a constraint for the sum of all the child heights and all the elements that are part of the fill.
-            if isinstance(self[child_id].height_constraint, (Fixed,FixedAspect,FromChildren,Named)):
-                hsum += self[child_id].height
-            elif isinstance(self[child_id].height_constraint, Fill):
-                hfill.append(child_id)
-            else:
-                pass
+            height_constraint = child._height_constraint
+            height_type = _constraint_kind(height_constraint)
+            if height_type is Fixed:
+                hsum += height_constraint.size
+            elif height_type in _SUMMED_CONSTRAINTS:
+                hsum += child._height
+            elif height_type is Fill:
+                hfill.append(child)
 
         # Add constraints if this node gets it's width/height from its child nodes.
-        if isinstance(self[id].height_constraint, FromChildren):
-            if self[id].is_child_layout_vertical:
-                self._solver.addConstraint((self[id].height==hsum) | "required")
-
-        if isinstance(self[id].width_constraint, FromChildren):
-            if self[id].is_child_layout_horizontal:
-                self._solver.addConstraint((self[id].width==wsum) | "required")
-
-        # Add constraints where child nodes fill to consume all the remaining space.
+        if isinstance(parent.height_constraint, FromChildren):
+            if parent.is_child_layout_vertical:
+                self._pending_constraints.append((parent.height==hsum) | "required")
+
+        if isinstance(parent.width_constraint, FromChildren):
+            if parent.is_child_layout_horizontal:
+                self._pending_constraints.append((parent.width==wsum) | "required")
+
+        # Add constraints where child nodes fill to consume all the remaining space.  Only the
+        # first filling child takes its share of the remaining space, the others are set equal
+        # to it, so the remaining space expression (which has a term for every sibling) is
+        # added to the solver once rather than once per filling child.
         if len(hfill)>0:
-            child_heights = (self[id].height-hsum)/float(len(hfill))
-            for key in hfill:
-                self._solver.addConstraint((self[key].height == child_heights) | 'required')
+            first = hfill[0]
+            self._pending_constraints.append((first.height == (parent.height-hsum)/float(len(hfill))) | 'required')
+            for child in hfill[1:]:
+                self._pending_constraints.append((child.height == first.height) | 'required')
         if len(wfill)>0:
-            child_widths = (self[id].width-wsum)/float(len(wfill))
-            for key in wfill:
-                self._solver.addConstraint((self[key].width == child_widths) | 'required')
+            first = wfill[0]
+            self._pending_constraints.append((first.width == (parent.width-wsum)/float(len(wfill))) | 'required')
+            for child in wfill[1:]:
+                self._pending_constraints.append((child.width == first.width) | 'required')
 
-        # recursively process child nodes
-        for child_id in self[id].child_iterator():
-            self._setup_child_constraints(child_id)
 
 
-    def _compute_coordinates(self):
+    def _compute_coordinates(self, parent_ids: list=None):
         """Compute coordinates for all the elements.
+
+        Parameters
+        ----------
+        parent_ids : list, optional
+            Ids of the elements with children, from _parent_ids, by default worked out here.
         """
-        self["base"].x_left = 0.0
-        self["base"].y_top = self["base"].height.value()
-        self["base"].x_right = self["base"].width.value()
-        self["base"].y_bottom = 0.0
-        self._compute_child_coordinates("base")
+        base = self._elements["base"]
+        width = base.width.value()
+        height = base.height.value()
+        base.x_left = 0.0
+        base.y_top = height
+        base.x_right = width
+        base.y_bottom = 0.0
+        compute_child_coordinates = self._compute_child_coordinates
+        for id in (self._parent_ids() if parent_ids is None else parent_ids):
+            compute_child_coordinates(id)
+
+        # Work out the normalised position of each element for creating and resetting axes.
+        # An empty base has no size, in which case every position is zero.
+        inv_width = 1.0/width if width!=0.0 else 0.0
+        inv_height = 1.0/height if height!=0.0 else 0.0
+        self._positions = {id: [e._x_left*inv_width, e._y_bottom*inv_height,
+                                (e._x_right-e._x_left)*inv_width, (e._y_top-e._y_bottom)*inv_height]
+                            for id, e in self._elements.items()}
 
 
     def _compute_child_coordinates(self, id: str):
         """Compute coordinates for all the child elements of a given id.
 
+        Only the direct children of id are processed, so the coordinates of id
+        must already have been set.
+
         Parameters
         ----------
         id : str
@@ -775,29 +1068,31 @@ class Layout:
         # the tree. If we are stepping across multiple sibling elements at the
         # same level, then these will increment so that we have the offset from
         # the beginning of each element
-        x_origin = self[id].x_left + self[id].margin_left
-        y_origin = self[id].y_top - self[id].margin_top
-
-        # Process all the child nodes, recursively processing as necessary.
-        for child_id in self[id].child_iterator():
+        elements = self._elements
+        parent = elements[id]
+        x_origin = float(parent._x_left + parent._margin_left)
+        y_origin = float(parent._y_top - parent._margin_top)
+        horizontal = parent._horizontal
+        padding = parent._child_padding
+
+        # Process all the child nodes, reading each solved size only once.
+        for child_id in parent._children:
+            child = elements[child_id]
+            width = child._width.value()
+            height = child._height.value()
 
             # Set the coordinates.
-            self[child_id].x_left = x_origin
-            self[child_id].y_top = y_origin
-            self[child_id].x_right = x_origin + self[child_id].width.value()
-            self[child_id].y_bottom = y_origin - self[child_id].height.value()
-
-            # If this child element also has child elements, then recursively
-            # process it.
-            if self[child_id].has_children:
-                self._compute_child_coordinates(child_id)
+            child._x_left = x_origin
+            child._y_top = y_origin
+            child._x_right = x_origin + width
+            child._y_bottom = y_origin - height
 
             # Shift the offset along, depending on whether this was a vertical
             # of horizontal layout
-            if self[id].is_child_layout_horizontal:
-                x_origin += self[child_id].width.value() + self[id].child_padding
-            if self[id].is_child_layout_vertical:
-                y_origin -= self[child_id].height.value() + self[id].child_padding
+            if horizontal:
+                x_origin += width + padding
+            else:
+                y_origin -= height + padding
 
 
     def preview(self, show: bool=True) -> Tuple[matplotlib.figure.Figure, matplotlib.axes.Axes]:
@@ -816,25 +1111,37 @@ class Layout:
         Tuple[matplotlib.figure.Figure, matplotlib.axes.Axes]
             The created figure and axes handles.
         """
-        fig = matplotlib.pyplot.figure()
-        ax = matplotlib.pyplot.gca()
+        import matplotlib.pyplot as plt
+        import matplotlib.patches
+        import matplotlib.collections
+
+        fig = plt.figure()
+        ax = plt.gca()
 
         # Used to cycle over the user's default colour map.
         colour_cycle = itertools.cycle(plt.rcParams['axes.prop_cycle'])
 
-        # Draw a rectangle for each element - elements with child elements are
-        # only drawn in outline.
-        for id in self._elements:
-            if id=="base" or self[id].has_children:
-                ax.add_patch(matplotlib.patches.Rectangle((self[id]._x_left, self[id]._y_bottom),
-                                                      self[id].width.value(), self[id].height.value(),
-                                                      fc="none", ec="black", linewidth=2))
+        # Make a rectangle for each element - elements with child elements are
+        # only drawn in outline.  The rectangles are gathered up and added as two
+        # collections rather than as one artist per element.
+        text = ax.text
+        Rectangle = matplotlib.patches.Rectangle
+        outlines = []
+        filled = []
+        colours = []
+        for id, element in self._elements.items():
+            x = element._x_left
+            y = element._y_bottom
+            w = element.width.value()
+            h = element.height.value()
+            if id=="base" or element.has_children:
+                outlines.append(Rectangle((x, y), w, h))
             else:
-                ax.add_patch(matplotlib.patches.Rectangle((self[id]._x_left, self[id]._y_bottom),
-                                                        self[id].width.value(), self[id].height.value(),
-                                                        fc=colour_cycle.__next__()["color"], ec="none"))
-                ax.text(self[id]._x_left + self[id].width.value()*0.5, self[id]._y_bottom + self[id].height.value()*0.5,
-                        id, color="black", horizontalalignment="center", verticalalignment="center")
+                filled.append(Rectangle((x, y), w, h))
+                colours.append(next(colour_cycle)["color"])
+                text(x + w*0.5, y + h*0.5, id, color="black", horizontalalignment="center", verticalalignment="center")
+        ax.add_collection(matplotlib.collections.PatchCollection(filled, facecolors=colours, edgecolors="none"))
+        ax.add_collection(matplotlib.collections.PatchCollection(outlines, facecolors="none", edgecolors="black", linewidths=2))
 
         ax.set_xlim(-1, self["base"].width.value()+1)
         ax.set_ylim(-1, self["base"].height.value()+1)
@@ -847,33 +1154,30 @@ class Layout:
         """Print a tree display of the plot layout.
         """
         print('base')
-        self._recurse_display(0, 'base')
-
 
-    def _recurse_display(self, indent_depth : int, element_id : str):
-        """Recursively display the contents of this layout.
-
-        Parameters
-        ----------
-        indent_depth : int
-            The depth we are at.
-        element_id : _type_
-            The element id that is the base of this part of the tree we are
-            recursing through.
-        """
-        # Format the text - could be simplified easily but needs some additional
-        # logic to fix the formatting.
-        indent = "│   "*indent_depth
-
-        # Loop over all the elements, if there are child elements
-        # in this node then we recurse over them.
-        for i,k in enumerate(self[element_id].child_iterator):
-            if i==self[element_id].num_children-1:
+        # Walk the tree with an explicit stack rather than by recursion so deep
+        # layouts don't hit the recursion limit.  Each entry is the depth, the
+        # element id and whether it is the last child of its parent; children
+        # are pushed in reverse so they come off the stack in order.
+        elements = self._elements
+        children = elements["base"]._children
+        last = len(children)-1
+        stack = [(0, k, i==last) for i,k in enumerate(children)][::-1]
+        while stack:
+            indent_depth, k, is_last = stack.pop()
+
+            # Format the text - could be simplified easily but needs some additional
+            # logic to fix the formatting.
+            indent = "│   "*indent_depth
+            if is_last:
                 print(indent+"└── "+k)
             else:
                 print(indent+"├── "+k)
-            if self[k].has_children:
-                self._recurse_display(indent_depth+1, k)
+
+            children = elements[k]._children
+            if children:
+                last = len(children)-1
+                stack.extend([(indent_depth+1, c, i==last) for i,c in enumerate(children)][::-1])
 
 
     def __getitem__(self, v: str) -> PlotElement:
@@ -909,96 +1213,119 @@ class Layout:
         TypeError
             Raised if a provided parent id is not a string, and if a provided new id is not a string or None.
         ValueError
-            Raised if a provided tuple has more than two ids in it (parent and new).
+            Raised if a provided tuple doesn't have two ids in it (parent and new).
+        UnknownElement
+            If the parent id is not known.
         """
 
-        # If ids is None then our default behaviour is to insert the element(s) as a child
-        # of the base node with the id in the element(s).
+        # Work out the parent id and any new id.  If ids is None then our default
+        # behaviour is to insert the element(s) as a child of the base node with the
+        # id in the element(s).
         if ids is None:
+            parent_id, new_id = "base", None
+
+        # Check for layout[parent_id, new_id] form.
+        elif isinstance(ids,tuple):
+            if len(ids)!=2:
+                raise ValueError('Expected two items (parent id and new id) but received {} items'.format(len(ids)))
 
-            if isinstance(element,PlotElement):
-                # Insert a single PlotElement
-                # print("Inserting single PlotElement into the base with its current ID")
-                self._elements[element.id] = element
-                self['base'].append_child(element.id)
-                self._solved = False
-
-            elif isinstance(element,collections.OrderedDict):
-                # Insert all the PlotElement objects from an ordered dictionary
-                # print("Inserting all PlotElements from OrderedDict into the base with their current IDs")
-                for k,v in element.items():
-                    self._elements[k] = v
-                    self["base"].append_child(k)
-                    self._solved = False
+            # If we are here then ids should be either (str,str) or (str,None). Check for this.
+            parent_id, new_id = ids
+            if not isinstance(parent_id,str):
+                raise TypeError('Parent id is not a string (received {})'.format(type(parent_id)))
+            if new_id is not None and not isinstance(new_id,str):
+                raise TypeError('New id must either be None or a string (received {})'.format(type(new_id)))
 
+        # Check for layout[new_id] form, adding to the base.
+        elif isinstance(ids,str):
+            parent_id, new_id = "base", ids
+
+        else:
+            raise TypeError("Expected either tuple or str but received {}".format(type(ids)))
+
+        if parent_id not in self._elements:
+            raise UnknownElement(parent_id)
+
+        # Insert using the handler for this type of element, falling back to
+        # isinstance for subclasses.
+        insert = self._INSERTERS.get(type(element))
+        if insert is None:
+            for cls, handler in self._INSERTERS.items():
+                if isinstance(element, cls):
+                    insert = handler
+                    break
             else:
                 raise TypeError('Expected either an OrderedDict of PlotElement objects or a PlotElement')
+        insert(self, parent_id, new_id, element)
+        self._solved = False
 
-        # ids is not None so the user has selected either a parent id, or a parent id
-        # and a new id for the inserted PlotElement.  Note that if we have an OrderedDict
-        # of PlotElements then we will ignore the new id.
-        else:
 
-            # Check for layout[parent_id, new_id] form.
-            if isinstance(ids,tuple):
-                if len(ids)>2:
-                    raise ValueError('Expected two items (parent id and new id) but received {} items'.format(len(ids)))
-
-                # If we are here then ids should be either (str,str) or (str,None). Check for this.
-                if not isinstance(ids[0],str):
-                    raise TypeError('Parent id is not a string (received {})'.format(type(ids[0])))
-                if ids[1] is not None:
-                    if not isinstance(ids[1],str):
-                        raise TypeError('New id must either be None or a string (received {})'.format(type(ids[1])))
-
-                # If we are here then we have a parentid string and a potential new id so we
-                # can go ahead and add the element(s).  NOTE: WE MIGHT WANT TO DO
-                # A CHECK HERE TO SEE IF parentid IS A MEMBER OF self._elements (TODO).
-
-                if ids[1] is None:
-                    # Put the object or objects as a child of the parentid with their existing ids.
-                    if isinstance(element,PlotElement):
-                        # print("Inserting single PlotElement into the given node with its current ID")
-                        self._elements[element.id] = element
-                        self["base"].append_child(element.id)
-                        self._solved = False
-
-                    elif isinstance(element,collections.OrderedDict):
-                        # print("Inserting all PlotElements from OrderedDict into the given node with their current IDs")
-                        for k,v in element.items():
-                            self._elements[k] = v
-                            self["base"].append_child(k)
-                        self._solved = False
-
-                    else:
-                        raise TypeError('Expected either an OrderedDict of elements or an element')
-
-                else:
-                    # Put the object as a child of parentid but set the id of the inserted element first.
-                    # print("Inserting single PlotElement into the given node with the new ID")
-                    element.id = ids[1]
-                    self._elements[element.id] = element
-                    self[ids[0]].append_child(element.id)
-                    self._solved = False
-
-            elif isinstance(ids,str):
-                if isinstance(element,PlotElement):
-                    # print("Inserting single PlotElement into the base node with a new ID")
-                    element.id = ids
-                    self._elements[element.id] = element
-                    self["base"].append_child(element.id)
-                    self._solved = False
-
-                elif isinstance(element,collections.OrderedDict):
-                    # print("Inserting all PlotElements from OrderedDict into the base node with their current IDs")
-                    warnings.warn("Ignoring new id when inserting multiple PlotElement objects", UserWarning)
-                    for k,v in element.items():
-                        self._elements[k] = v
-                        self["base"].append_child(k)
-                    self._solved = False
+    def _insert_element(self, parent_id: str, new_id: Union[str,None], element: PlotElement):
+        """Insert a single PlotElement as a child of a given parent.
 
-            else:
-                raise TypeError("Expected either tuple or str but received {}".format(type(ids)))
+        Parameters
+        ----------
+        parent_id : str
+            Id of the parent element.
+        new_id : Union[str,None]
+            New id for the element, or None to keep its existing id.
+        element : PlotElement
+            Element to insert.
+        """
+        if new_id is not None:
+            element.id = new_id
+        self._elements[element.id] = element
+        self._elements[parent_id].append_child(element.id)
+
+
+    def _insert_elements(self, parent_id: str, new_id: Union[str,None], elements: collections.OrderedDict):
+        """Insert all the PlotElement objects from an OrderedDict as children of a given parent.
+
+        Parameters
+        ----------
+        parent_id : str
+            Id of the parent element.
+        new_id : Union[str,None]
+            Ignored, with a warning if given, since each element is added under its key.
+        elements : collections.OrderedDict
+            Elements to insert.
+        """
+        if new_id is not None:
+            warnings.warn("Ignoring new id when inserting multiple PlotElement objects", UserWarning)
+        parent = self._elements[parent_id]
+        for k,v in elements.items():
+            self._elements[k] = v
+            parent.append_child(k)
+
+
+    # Insertion handlers for __setitem__, keyed by the type of element being inserted.
+    _INSERTERS = {PlotElement: _insert_element, collections.OrderedDict: _insert_elements}
+
+
+    def _bulk_insert(self, children: Dict[str,list]):
+        """Add many PlotElements at once without going through __setitem__.
+
+        Parameters
+        ----------
+        children : Dict[str,list]
+            Lists of PlotElement objects to append, indexed by parent id, each
+            added under its own id.  Parents must either already be in the
+            layout or appear earlier in the dictionary.
+
+        Raises
+        ------
+        UnknownElement
+            If a parent id is not known.
+        """
+        elements = self._elements
+        for parent_id, new_elements in children.items():
+            if parent_id not in elements:
+                raise UnknownElement(parent_id)
+            parent = elements[parent_id]
+            for element in new_elements:
+                elements[element.id] = element
+                parent.append_child(element.id)
+        self._solved = False
 
 
     def figure(self) -> matplotlib.figure.Figure:
@@ -1017,7 +1344,34 @@ class Layout:
 
         if not self._solved:
             raise NoSolution("Cannot create a figure since the layout has not been solved and so the width and height are unknown")
-        return matplotlib.pyplot.figure(figsize=(self["base"].width.value()/2.54,self["base"].height.value()/2.54))
+        import matplotlib.pyplot
+        self._figure = matplotlib.pyplot.figure(figsize=(self["base"].width.value()/2.54,self["base"].height.value()/2.54))
+        return self._figure
+
+
+    def figure_with_axes(self) -> matplotlib.figure.Figure:
+        """Generate the Matplotlib Figure and an Axes for every element without child elements.
+
+        The axes are added straight to the new figure in one pass rather than through pyplot
+        one element at a time, and can then be retrieved with axes(id).
+
+        Returns
+        -------
+        matplotlib.figure.Figure
+            Figure object.
+
+        Raises
+        ------
+        NoSolution
+            If the layout has not yet been solved.
+        """
+        fig = self.figure()
+        add_axes = fig.add_axes
+        positions = self._positions
+        for id, element in self._elements.items():
+            if not element._children:
+                element.axes = add_axes(positions[id])
+        return fig
 
 
     def axes(self, id: str) -> matplotlib.axes.Axes:
@@ -1044,10 +1398,12 @@ class Layout:
             raise NoSolution("Cannot create the axes since the layout has not been solved and so the width, height and position are unknown")
 
         if self[id].axes is None:
-            self[id].axes = matplotlib.pyplot.axes([self[id].x_left/self["base"].width.value(),
-                                                self[id].y_bottom/self["base"].height.value(),
-                                                self[id].width.value()/self["base"].width.value(),
-                                                self[id].height.value()/self["base"].height.value()])
+            # Add straight to our figure rather than going through pyplot's current figure.
+            fig = self._figure
+            if fig is None:
+                import matplotlib.pyplot
+                fig = matplotlib.pyplot.gcf()
+            self[id].axes = fig.add_axes(self._positions[id])
 
         return self[id].axes
 
@@ -1082,28 +1438,47 @@ class Layout:
             warnings.warn("This PlotElement doesn't have an axis to reset - creating the axis")
             self.axes(id)
         else:
-            self[id].axes.set_position([self[id].x_left.value()/self["base"].width.value(),
-                                                self[id].y_bottom.value()/self["base"].height.value(),
-                                                self[id].width.value()/self["base"].width.value(),
-                                                self[id].height.value()/self["base"].height.value()])
+            self[id].axes.set_position(self._positions[id])
 
 
     def to_dict(self) -> dict:
         """Convert this Layout, and all the PlotElements and their constraints to a dictionary
 
+        The dictionary is a copy, so it can be modified without affecting this Layout or the
+        constraints.
+
         Returns
         -------
         dict
         """
+        element_to_dict = PlotElement.to_dict
+        return {"zool":{"version":"ver",
+                        "solved":self._solved,
+                        "plotElements":{k: element_to_dict(v) for k,v in self._elements.items()}}}
+
+    def _to_dict(self) -> dict:
+        """Convert this Layout to a dictionary that shares the cached element dictionaries.
+
+        The element and constraint dictionaries are shared with the PlotElement and constraint
+        caches, so this must only be used where the result is serialised straight away.
+
+        Returns
+        -------
+        dict
+        """
+        element_to_dict = PlotElement._to_dict
         d = {"zool":{"version":"ver",
                      "solved":self._solved,
-                     "plotElements":{k: v.to_dict() for k,v in self._elements.items()}}}
+                     "plotElements":{k: element_to_dict(v) for k,v in self._elements.items()}}}
 
         return d
 
     def to_json(self, **kwargs) -> str:
         """Serialise this Layout to a JSON string.
 
+        If no keyword arguments are given then the JSON is compact, produced by
+        orjson if it is installed, otherwise the standard library is used.
+
         Parameters
         ----------
         Any keyword arguments are passed onto the JSON serialiser.
@@ -1113,8 +1488,10 @@ class Layout:
         str
             String of JSON.
         """
-        d = self.to_dict()
-        return json.dumps(d, **kwargs)
+        d = self._to_dict()
+        if orjson is not None and not kwargs:
+            return orjson.dumps(d, option=_ORJSON_OPTIONS).decode()
+        return json.dumps(d, **(kwargs or _COMPACT_JSON))
 
     def save(self, filename: str, **kwargs):
         """Serialise this Layout to a JSON file.
@@ -1123,26 +1500,30 @@ class Layout:
         ----------
         filename : str
             Filename to write to, if the filename doesn't end in .json then this will be appended.
-        Any keyword arguments are passed onto the JSON serialiser.
+        Any keyword arguments are passed onto the JSON serialiser.  If there are no keyword
+        arguments then the JSON is compact, and written by orjson if it is installed.
         """
 
-        d = self.to_dict()
-        with open(filename if filename[-5:]==".json" else filename+".json", 'w') as fh:
-            json.dump(d, fh, **kwargs)
-        d = {"zool":{"version":"ver",
-                     "solved":self._solved,
-                     "plotElements":{k: v.to_dict() for k,v in self._elements.items()}}}
+        d = self._to_dict()
+        if not filename.endswith(".json"):
+            filename += ".json"
+        if orjson is not None and not kwargs:
+            with open(filename, 'wb') as fh:
+                fh.write(orjson.dumps(d, option=_ORJSON_OPTIONS))
+        else:
+            with open(filename, 'w') as fh:
+                json.dump(d, fh, **(kwargs or _COMPACT_JSON))
 
     @classmethod
-    def from_json(cls: Type[_T], json_string: str) -> _T:
+    def from_json(cls: Type[_T], json_string: Union[str,bytes]) -> _T:
         """Deserialise JSON string to create a new Layout and set of PlotElement objects.
 
         Parameters
         ----------
         cls : Type[_T]
             Layout object.
-        json_string : str
-            String of JSON to deserialise.
+        json_string : Union[str,bytes]
+            String of JSON to deserialise, parsed by orjson if it is installed.
 
         Returns
         -------
@@ -1150,35 +1531,8 @@ class Layout:
             Layout object.
         """
 
-        def recursively_parse(layout: Type[_T], elements: dict, parentId: str):
-            """Recursively add all the child elements of a given id.
-
-            Parameters
-            ----------
-            layout : Type[_T]
-                Layout object.
-            elements : dict
-                Dictionary of serialised PlotElements.
-            parentId : _type_
-                Parent id of the child elements to add.
-            """
-            for childId in elements[parentId]["childLabels"]:
-                layout[parentId,childId] = PlotElement(
-                        width=constraint_deserialiser(elements[childId]["widthConstraint"]),
-                        height=constraint_deserialiser(elements[childId]["heightConstraint"]),
-                    margin_left=elements[childId]["marginLeft"],
-                    margin_right=elements[childId]["marginRight"],
-                    margin_top=elements[childId]["marginTop"],
-                    margin_bottom=elements[childId]["marginBottom"],
-                    layout=elements[childId]["childLayoutDirection"],
-                    padding=elements[childId]["childPadding"])
-
-            for childId in elements[parentId]["childLabels"]:
-                if len(elements[childId]["childLabels"])>0:
-                    recursively_parse(layout, elements, childId)
-
         # Parse the JSON into a dictionary.
-        d = json.loads(json_string)
+        d = json.loads(json_string) if orjson is None else orjson.loads(json_string)
 
         # Make sure this is a Zool dictionary.
         if "zool" not in d:
@@ -1200,8 +1554,35 @@ class Layout:
                     layout=elements["base"]["childLayoutDirection"],
                     padding=elements["base"]["childPadding"])
 
-        # Recursively add all the child elements, solve the layout and return.
-        recursively_parse(layout, elements, "base")
+        # Build all the child elements, working down the tree with an explicit
+        # stack rather than by recursion.  Parents with children are pushed in
+        # reverse so that each subtree is added in the order it was saved.
+        deserialise = constraint_deserialiser
+        children = {}
+        stack = ["base"]
+        while stack:
+            parentId = stack.pop()
+            parents = []
+            new_elements = children[parentId] = []
+            for childId in elements[parentId]["childLabels"]:
+                child = elements[childId]
+                new_elements.append(PlotElement(id=childId,
+                        width=deserialise(child["widthConstraint"]),
+                        height=deserialise(child["heightConstraint"]),
+                    margin_left=child["marginLeft"],
+                    margin_right=child["marginRight"],
+                    margin_top=child["marginTop"],
+                    margin_bottom=child["marginBottom"],
+                    layout=child["childLayoutDirection"],
+                    padding=child["childPadding"]))
+                if len(child["childLabels"])>0:
+                    parents.append(childId)
+            stack.extend(reversed(parents))
+
+        # Add them all to the layout in one go.
+        layout._bulk_insert(children)
+
+        # Solve the layout and return.
         layout.layout()
         return layout
 
@@ -1221,7 +1602,9 @@ class Layout:
         _T
             Layout object.
         """
-        with open(filename, "r") as fh:
-            d = json.load(fh)
+        # Read the raw bytes and let from_json parse them, so orjson can be used
+        # when it's installed.
+        with open(filename, "rb") as fh:
+            json_string = fh.read()
 
-        return cls.from_json(d)
+        return cls.from_json(json_string)
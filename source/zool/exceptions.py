@@ -88,3 +88,23 @@ class DeserialisationError(ZoolError):
         """
         self.constraint = constraint
         self.message = message
+
+
+class UserError(ZoolError):
+    """Exception raised for invalid combinations of user-supplied arguments.
+
+    Attributes
+    ----------
+    message : str
+        The message accompanying the error.
+    """
+
+    def __init__(self, message: str):
+        """Initialise.
+
+        Parameters
+        ----------
+        message : str
+            The message accompanying the error.
+        """
+        self.message = message
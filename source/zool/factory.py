@@ -3,37 +3,30 @@
 
 # Zool modules.
 import zool.core
+from zool.exceptions import UserError
 
 
 def vertical_stack(heights, labels=None, **kwargs):
     """This function returns a standard vertical stack of panels.
 
-    Additional keyword arguments are passed straight through to the Plot class
-    constructor.
+    Additional keyword arguments are passed straight through to the Layout
+    class constructor.
 
     Args:
     :param heights list: List of panel heights (in cm).
     :param labels list: Optional list of panel labels.
-    :return Zool figure object: Plot layout.
+    :return Zool Layout object: Plot layout.
     """
-    fig = zool.Figure(
+    fig = zool.core.Layout(
         figheight=zool.core.FromChildren(), layout="vertical", **kwargs
     )
     for i in range(len(heights)):
-        if labels is None:
-            fig.add(
-                "base",
+        fig["base", str(i) if labels is None else labels[i]] = (
+            zool.core.PlotElement(
                 width=zool.core.FromParent(),
                 height=zool.core.Fixed(heights[i]),
-                label=str(i),
-            )
-        else:
-            fig.add(
-                "base",
-                width=zool.core.FromParent(),
-                height=zool.core.Fixed(heights[i]),
-                label=labels[i],
             )
+        )
 
     fig.layout()
     return fig
@@ -43,89 +36,94 @@ def triangle(vars, d2d=4.0, d1d=1.0, m_padding=0.2, t_padding=0.1, **kwargs):
     """This function returns a triangle plot of panels.
 
     Additional keyword arguments are passed straight through to the
-    Figure class constructor.
+    Layout class constructor.
 
     Args:
-    :param n int: Number of variables to plot in the triangle (n x n).
+    :param vars list: Names of the n variables to plot in the triangle,
+        at least two.
     :param d2d float: Dimension of the (square) 2d histograms.
     :param d1d float: Dimension of the 1d marginals.
     :param m_padding float: Padding between vertical panels (cm).
     :param t_padding float: Padding between panels in each vertical set (cm).
-    :return Zool figure object: Plot layout.
+    :return Zool Layout object: Plot layout.
     """
-
-    fig = zool.Figure(
+    n = len(vars)
+    if n < 2:
+        raise UserError("A triangle plot needs at least two variables")
+
+    # Every vertical frame holds one 1d marginal and (n-1) 2d panels, so the
+    # figure height is known up front (the base can't be named after one of
+    # its own frames).
+    figheight = (
+        d1d
+        + (n - 1) * (d2d + t_padding)
+        + kwargs.get("margin_top", 0.0)
+        + kwargs.get("margin_bottom", 0.0)
+    )
+    fig = zool.core.Layout(
         figwidth=zool.core.FromChildren(),
-        figheight=zool.core.Named("tleft-frame"),
+        figheight=zool.core.Fixed(figheight),
         layout="horizontal",
         padding=m_padding,
         **kwargs,
     )
-    n = len(vars)
 
     # Setup the vertical frames that will hold all the histograms. The
     # arrangement is for a left-hand frame to hold the marginals for each
     # horizontal row plus (n+1) vertical frames to hold the n variables.
-    fig.add(
-        "base",
+    fig["base", "tleft-frame"] = zool.core.PlotElement(
         width=zool.core.Fixed(d1d),
         height=zool.core.FromChildren(),
         layout="vertical",
         padding=t_padding,
-        label="tleft-frame",
     )
     for i in range(n - 1):
-        fig.add(
-            "base",
-            width=zool.Fixed(d2d),
+        fig["base", f"t{i + 1:1d}-frame"] = zool.core.PlotElement(
+            width=zool.core.Fixed(d2d),
             height=zool.core.FromChildren(),
             layout="vertical",
             padding=t_padding,
-            label="t{:1d}-frame".format(i + 1),
         )
 
     # Add marginal histograms to the left-hand frame, including some padding at
     # the top for alignment.
-    fig.add(
-        "tleft-frame", width=zool.core.FromParent(), height=zool.Fixed(d1d)
+    fig["tleft-frame", None] = zool.core.PlotElement(
+        width=zool.core.FromParent(), height=zool.core.Fixed(d1d)
     )
     # 				label='{:1d}-top-padding'.format(i+1))
     for i in range(n - 1, 0, -1):
-        fig.add(
-            "tleft-frame",
+        fig["tleft-frame", f"{vars[i]}-1d-v"] = zool.core.PlotElement(
             width=zool.core.FromParent(),
-            height=zool.Fixed(d2d),
-            label="{}-1d-v".format(vars[i]),
+            height=zool.core.Fixed(d2d),
         )
 
     # Add 1D marginal and 2D histograms in the other frames.
-    varindex = [0] + list(range(n - 1, 1, -1))
+    # The first frame holds the first variable's column, then the rest run
+    # from the last variable backwards.
     for i in range(n - 1):
-        frame = "t{:1d}-frame".format(i + 1)
-        k = varindex[i]
+        frame = f"t{i + 1:1d}-frame"
+        k = n - i if i else 0
 
         # Add padding at the top for alignment.
         for j in range(i):
-            fig.add(
-                frame, width=zool.core.FromParent(), height=zool.Fixed(d2d)
+            fig[frame, None] = zool.core.PlotElement(
+                width=zool.core.FromParent(), height=zool.core.Fixed(d2d)
             )
         # 				label='{:1d}-{:1d}-padding'.format(i+1,j+1))
 
         # Add 1d marginal at the top of the column.
-        fig.add(
-            frame,
+        fig[frame, f"{vars[k]}-1d-h"] = zool.core.PlotElement(
             width=zool.core.FromParent(),
-            height=zool.Fixed(d1d),
-            label="{}-1d-h".format(vars[k]),
+            height=zool.core.Fixed(d1d),
         )
 
         # Add 2d histograms.
         for j in range(n - 1 - i, 0, -1):
-            fig.add(
-                frame,
-                width=zool.core.FromParent(),
-                height=zool.Fixed(d2d),
-                label="{}-{}-2d".format(vars[k], vars[j]),
+            fig[frame, f"{vars[k]}-{vars[j]}-2d"] = (
+                zool.core.PlotElement(
+                    width=zool.core.FromParent(),
+                    height=zool.core.Fixed(d2d),
+                )
             )
 
     # Finish the layout and make the figure.
@@ -140,90 +138,109 @@ def triangle_equal(
     """This function returns a triangle plot of panels.
 
     Additional keyword arguments are passed straight through to the
-    Figure class constructor.
+    Layout class constructor.
 
     Args:
-    :param n int: Number of variables to plot in the triangle (n x n).
+    :param vars list: Names of the n variables to plot in the triangle,
+        at least two.
+    :param figwidth float: Width of the figure (cm), either a number or a
+        Fixed constraint since the panel sizes are worked out from it.
     :param d1d float: Dimension of the 1d marginals.
     :param m_padding float: Padding between vertical panels (cm).
     :param t_padding float: Padding between panels in each vertical set (cm).
-    :return Zool figure object: Plot layout.
+    :return Zool Layout object: Plot layout.
     """
-
-    fig = zool.Figure(
+    n = len(vars)
+    if n < 2:
+        raise UserError("A triangle plot needs at least two variables")
+    if isinstance(figwidth, zool.core.Fixed):
+        width = figwidth.size
+    elif isinstance(figwidth, (float, int)):
+        width = figwidth
+    else:
+        raise UserError("Figure width must be a number or a Fixed constraint")
+
+    # The (n-1) frames share out the width left over from the marginals and
+    # the 2d panels are square, so the figure height follows from the width
+    # (the base can't be named after one of its own frames).
+    d2d = (
+        width
+        - kwargs.get("margin_left", 0.0)
+        - kwargs.get("margin_right", 0.0)
+        - d1d
+        - (n - 1) * m_padding
+    ) / (n - 1)
+    figheight = (
+        d1d
+        + (n - 1) * (d2d + t_padding)
+        + kwargs.get("margin_top", 0.0)
+        + kwargs.get("margin_bottom", 0.0)
+    )
+    fig = zool.core.Layout(
         figwidth=figwidth,
-        figheight=zool.core.Named("tleft-frame"),
+        figheight=zool.core.Fixed(figheight),
         layout="horizontal",
         padding=m_padding,
         **kwargs,
     )
-    n = len(vars)
 
     # Setup the vertical frames that will hold all the histograms. The
     # arrangement is for a left-hand frame to hold the marginals for each
     # horizontal row plus (n+1) vertical frames to hold the n variables.
-    fig.add(
-        "base",
+    fig["base", "tleft-frame"] = zool.core.PlotElement(
         width=zool.core.Fixed(d1d),
         height=zool.core.FromChildren(),
         layout="vertical",
         padding=t_padding,
-        label="tleft-frame",
     )
     for i in range(n - 1):
-        fig.add(
-            "base",
+        fig["base", f"t{i + 1:1d}-frame"] = zool.core.PlotElement(
             width=zool.core.Fill(),
             height=zool.core.FromChildren(),
             layout="vertical",
             padding=t_padding,
-            label="t{:1d}-frame".format(i + 1),
         )
 
     # Add marginal histograms to the left-hand frame, including some padding at
     # the top for alignment.
-    fig.add(
-        "tleft-frame", width=zool.core.FromParent(), height=zool.Fixed(d1d)
+    fig["tleft-frame", None] = zool.core.PlotElement(
+        width=zool.core.FromParent(), height=zool.core.Fixed(d1d)
     )
     # 				label='{:1d}-top-padding'.format(i+1))
     for i in range(n - 1, 0, -1):
-        fig.add(
-            "tleft-frame",
+        fig["tleft-frame", f"{vars[i]}-1d-v"] = zool.core.PlotElement(
             width=zool.core.FromParent(),
-            height=zool.Named("{}-{}-2d".format(vars[0], vars[1])),
-            label="{}-1d-v".format(vars[i]),
+            height=zool.core.Named(f"{vars[0]}-{vars[1]}-2d"),
         )
 
     # Add 1D marginal and 2D histograms in the other frames.
-    varindex = [0] + list(range(n - 1, 1, -1))
+    # The first frame holds the first variable's column, then the rest run
+    # from the last variable backwards.
     for i in range(n - 1):
-        frame = "t{:1d}-frame".format(i + 1)
-        k = varindex[i]
+        frame = f"t{i + 1:1d}-frame"
+        k = n - i if i else 0
 
         # Add padding at the top for alignment.
         for j in range(i):
-            fig.add(
-                frame,
+            fig[frame, None] = zool.core.PlotElement(
                 width=zool.core.FromParent(),
-                height=zool.FixedAspect(1.0),
+                height=zool.core.FixedAspect(1.0),
             )
         # 				label='{:1d}-{:1d}-padding'.format(i+1,j+1))
 
         # Add 1d marginal at the top of the column.
-        fig.add(
-            frame,
+        fig[frame, f"{vars[k]}-1d-h"] = zool.core.PlotElement(
             width=zool.core.FromParent(),
-            height=zool.Fixed(d1d),
-            label="{}-1d-h".format(vars[k]),
+            height=zool.core.Fixed(d1d),
         )
 
         # Add 2d histograms.
         for j in range(n - 1 - i, 0, -1):
-            fig.add(
-                frame,
-                width=zool.core.FromParent(),
-                height=zool.FixedAspect(1.0),
-                label="{}-{}-2d".format(vars[k], vars[j]),
+            fig[frame, f"{vars[k]}-{vars[j]}-2d"] = (
+                zool.core.PlotElement(
+                    width=zool.core.FromParent(),
+                    height=zool.core.FixedAspect(1.0),
+                )
             )
 
     # Finish the layout and make the figure.
@@ -245,7 +262,7 @@ def subplot(
     """This function returns a simple grid plot of panels.
 
     Additional keyword arguments are passed straight through to the
-    Figure class constructor.  This function can only accept either
+    Layout class constructor.  This function can only accept either
     fixed_height or a fixed_aspect specification, both or neither
     will generate an exception.
 
@@ -257,7 +274,7 @@ def subplot(
     :param fixed_aspect: If specified, this is the fixed aspect ratio of each panel.
     :param label_fmt str: Format string for how each panel is labelled.
     :param padding float: Padding between each panel.
-    :return Zool figure object: Plot layout.
+    :return Zool Layout object: Plot layout.
     """
     if (fixed_height is None) and (fixed_aspect is None):
         raise UserError(
@@ -269,56 +286,52 @@ def subplot(
         )
 
     if fixed_height is not None:
-        layout = zool.Figure(
-            figwidth=zool.Fixed(width),
-            figheight=zool.Fixed(fixed_height),
+        layout = zool.core.Layout(
+            figwidth=zool.core.Fixed(width),
+            figheight=zool.core.Fixed(fixed_height),
             layout="vertical",
             padding=padding,
             **kwargs,
         )
     if fixed_aspect is not None:
-        layout = zool.Figure(
-            figwidth=zool.Fixed(width),
-            figheight=zool.FromChildren(),
+        layout = zool.core.Layout(
+            figwidth=zool.core.Fixed(width),
+            figheight=zool.core.FromChildren(),
             layout="vertical",
             padding=padding,
             **kwargs,
         )
 
     for j in range(nrows):
-        rlabel = "r{:02d}".format(j + 1)
+        rlabel = f"r{j + 1:02d}"
         if fixed_aspect is not None:
-            layout.add(
-                "base",
+            layout["base", rlabel] = zool.core.PlotElement(
                 width=zool.core.FromParent(),
-                height=zool.Named(label_fmt.format(1, 1)),
+                height=zool.core.Named(label_fmt.format(1, 1)),
                 layout="horizontal",
                 padding=padding,
-                label=rlabel,
             )
         if fixed_height is not None:
-            layout.add(
-                "base",
+            layout["base", rlabel] = zool.core.PlotElement(
                 width=zool.core.FromParent(),
-                height=zool.Fill(),
+                height=zool.core.Fill(),
                 layout="horizontal",
                 padding=padding,
-                label=rlabel,
             )
         for i in range(ncolumns):
             if fixed_aspect is not None:
-                layout.add(
-                    rlabel,
-                    width=zool.Fill(),
-                    height=zool.core.FixedAspect(fixed_aspect),
-                    label=label_fmt.format(j + 1, i + 1),
+                layout[rlabel, label_fmt.format(j + 1, i + 1)] = (
+                    zool.core.PlotElement(
+                        width=zool.core.Fill(),
+                        height=zool.core.FixedAspect(fixed_aspect),
+                    )
                 )
             if fixed_height is not None:
-                layout.add(
-                    rlabel,
-                    width=zool.Fill(),
-                    height=zool.core.FromParent(),
-                    label=label_fmt.format(j + 1, i + 1),
+                layout[rlabel, label_fmt.format(j + 1, i + 1)] = (
+                    zool.core.PlotElement(
+                        width=zool.core.Fill(),
+                        height=zool.core.FromParent(),
+                    )
                 )
     layout.layout()
     return layout
@@ -1,6 +1,9 @@
+import contextlib
+import io
 import unittest
 
 import zool
+from zool.exceptions import UnknownElement
 
 
 class TestPlotElement(unittest.TestCase):
@@ -30,6 +33,70 @@ class TestLayoutSetting(unittest.TestCase):
         layout = zool.Layout()
         with self.assertRaises(ValueError):
             layout["base", "a", "b"] = zool.PlotElement()
+        with self.assertRaises(TypeError):
+            layout["base", "a"] = "not an element"
+        with self.assertRaises(UnknownElement):
+            layout["missing", "a"] = zool.PlotElement()
+
+    def test_insert_with_existing_id(self):
+        layout = zool.Layout()
+        layout["a"] = zool.PlotElement()
+        layout["a", None] = zool.PlotElement(id="b")
+        self.assertEqual(list(layout["a"].child_iterator), ["b"])
+        self.assertEqual(list(layout["base"].child_iterator), ["a"])
+        with self.assertRaises(AttributeError):
+            layout["base"].child_iterator.append("c")
+
+
+class TestLayoutDisplay(unittest.TestCase):
+    """Check that a Layout prints its tree of elements."""
+
+    def test_display(self):
+        layout = zool.Layout()
+        layout["a"] = zool.PlotElement()
+        layout["a", "b"] = zool.PlotElement()
+        layout["c"] = zool.PlotElement()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            layout.display()
+        self.assertEqual(
+            output.getvalue(), "base\n├── a\n│   └── b\n└── c\n"
+        )
+
+
+class TestLayoutAxes(unittest.TestCase):
+    """Check that axes are created and reset at the solved positions."""
+
+    def test_axes(self):
+        layout = zool.Layout(figwidth=10.0, figheight=4.0, layout="horizontal")
+        layout["a"] = zool.PlotElement(width=zool.Fill())
+        layout["b"] = zool.PlotElement(width=zool.Fill())
+        layout.layout()
+        fig = layout.figure()
+
+        ax = layout.axes("b")
+        self.assertIs(ax.figure, fig)
+        for v, expected in zip(ax.get_position().bounds, (0.5, 0, 0.5, 1)):
+            self.assertAlmostEqual(v, expected)
+
+        ax.set_position([0.1, 0.1, 0.2, 0.2])
+        layout.reset_axis("b")
+        for v, expected in zip(ax.get_position().bounds, (0.5, 0, 0.5, 1)):
+            self.assertAlmostEqual(v, expected)
+
+    def test_figure_with_axes(self):
+        layout = zool.Layout(figwidth=10.0, figheight=4.0, layout="horizontal")
+        layout["a"] = zool.PlotElement(width=zool.Fill())
+        layout["b"] = zool.PlotElement(width=zool.Fill())
+        layout.layout()
+        fig = layout.figure_with_axes()
+
+        self.assertEqual(len(fig.axes), 2)
+        self.assertIs(layout.axes("a"), fig.axes[0])
+        for v, expected in zip(
+            layout.axes("b").get_position().bounds, (0.5, 0, 0.5, 1)
+        ):
+            self.assertAlmostEqual(v, expected)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,41 @@
+import os
+import tempfile
 import unittest
 
+import numpy as np
+
 import zool
+from zool.constraints import constraint_deserialiser
+from zool.exceptions import DeserialisationError
+
+
+class TestConstraintSerialisation(unittest.TestCase):
+    def test_round_trip(self):
+        """Check that each constraint survives serialisation."""
+        for constraint in (
+            zool.Fixed(2.5),
+            zool.FixedAspect(1.5),
+            zool.Named("a"),
+            zool.Fill(),
+            zool.FromChildren(),
+            zool.FromParent(),
+        ):
+            v = constraint_deserialiser(constraint.to_dict())
+            self.assertIs(type(v), type(constraint))
+            self.assertEqual(v.to_dict(), constraint.to_dict())
+
+    def test_bad_constraint(self):
+        """Check that incomplete or unknown constraints are rejected."""
+        with self.assertRaises(TypeError):
+            constraint_deserialiser("fixed")
+        with self.assertRaises(DeserialisationError):
+            constraint_deserialiser({"size": 1.0})
+        with self.assertRaises(DeserialisationError):
+            constraint_deserialiser({"constraint": "fixed"})
+        with self.assertRaises(DeserialisationError):
+            constraint_deserialiser({"constraint": "unknown"})
+        with self.assertRaises(DeserialisationError):
+            constraint_deserialiser({"constraint": ["fixed"]})
 
 
 class TestPlotElement(unittest.TestCase):
@@ -75,6 +110,79 @@ class TestPlotElement(unittest.TestCase):
         self.assertAlmostEqual(layout2["five"].height.value(), 3)
         self.assertAlmostEqual(layout2["five"].width.value(), 3.5)
 
+    def test_nested_order(self):
+        """Test nested elements are restored in the order they were saved."""
+        layout = zool.Layout(figwidth=10.0, figheight=10.0)
+        layout["a"] = zool.PlotElement(height=zool.Fill())
+        layout["a", "a1"] = zool.PlotElement()
+        layout["a1", "a11"] = zool.PlotElement()
+        layout["a", "a2"] = zool.PlotElement(height=zool.Fill())
+        layout["b"] = zool.PlotElement(height=zool.Fill())
+        layout["b", "b1"] = zool.PlotElement()
+        layout.layout()
+
+        layout2 = zool.Layout.from_json(layout.to_json())
+        self.assertEqual(
+            list(layout2.to_dict()["zool"]["plotElements"]),
+            ["base", "a", "b", "a1", "a2", "a11", "b1"],
+        )
+        self.assertAlmostEqual(layout2["a11"].height.value(), 5)
+        self.assertAlmostEqual(layout2["b1"].y_top, 5)
+
+    def test_save_load(self):
+        """Test a layout saved to a file can be loaded back."""
+        layout = zool.Layout(figwidth=10.0, figheight=4.0, layout="horizontal")
+        layout["a"] = zool.PlotElement(width=3.0)
+        layout["b"] = zool.PlotElement(width=zool.Fill())
+        layout.layout()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            layout.save(os.path.join(tmp, "layout"))
+            layout2 = zool.Layout.load(os.path.join(tmp, "layout.json"))
+
+        self.assertAlmostEqual(layout2["b"].width.value(), 7)
+        self.assertAlmostEqual(layout2["b"].x_left, 3)
+
+    def test_to_dict_is_a_copy(self):
+        """Test modifying the dictionary doesn't change the layout."""
+        layout = zool.Layout(figwidth=10.0, figheight=4.0)
+        layout["a"] = zool.PlotElement(width=zool.FromParent(), height=2.0)
+        d = layout.to_dict()
+        d["zool"]["plotElements"]["a"]["widthConstraint"]["constraint"] = "x"
+        d["zool"]["plotElements"]["base"]["childLabels"].append("b")
+
+        self.assertEqual(
+            zool.FromParent().to_dict(), {"constraint": "fromParent"}
+        )
+        self.assertEqual(
+            layout.to_dict()["zool"]["plotElements"]["base"]["childLabels"],
+            ["a"],
+        )
+
+        d = layout["a"].to_dict()
+        d["heightConstraint"]["size"] = 5.0
+        d["label"] = "b"
+        self.assertEqual(
+            layout["a"].to_dict()["heightConstraint"],
+            {"constraint": "fixed", "size": 2.0},
+        )
+        self.assertEqual(layout["a"].to_dict()["label"], "a")
+
+    def test_numpy_values(self):
+        """Test NumPy scalar sizes and margins can be serialised."""
+        layout = zool.Layout(figwidth=10.0, margin_left=np.float64(0.5))
+        layout["a"] = zool.PlotElement(height=zool.Fixed(np.float64(3.0)))
+        layout.layout()
+
+        layout2 = zool.Layout.from_json(layout.to_json())
+        self.assertAlmostEqual(layout2["base"].margin_left, 0.5)
+        self.assertAlmostEqual(layout2["a"].height.value(), 3.0)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            layout.save(os.path.join(tmp, "layout"))
+            layout3 = zool.Layout.load(os.path.join(tmp, "layout.json"))
+        self.assertAlmostEqual(layout3["a"].height.value(), 3.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -51,17 +51,22 @@ class TestKiwiLayout(unittest.TestCase):
         s.updateVariables()
 
         # Check results
-        self.assertEqual(fig_w.value(), 20)
-        self.assertEqual(fig_h.value(), 16)
-        self.assertEqual(p1_w.value(), 20)
-        self.assertEqual(p1_h.value(), 5)
-        self.assertEqual(p2_w.value(), 20)
-        self.assertEqual(p2_h.value(), 10)
-        self.assertEqual(p2a_w.value(), 9.5)
-        self.assertEqual(p2a_h.value(), 10)
-        self.assertEqual(p2b_w.value(), 9.5)
-        self.assertEqual(p2b_h.value(), 10)
-        self.assertEqual(padding.value(), 1.0)
+        self.assertEqual(
+            (
+                fig_w.value(),
+                fig_h.value(),
+                p1_w.value(),
+                p1_h.value(),
+                p2_w.value(),
+                p2_h.value(),
+                p2a_w.value(),
+                p2a_h.value(),
+                p2b_w.value(),
+                p2b_h.value(),
+                padding.value(),
+            ),
+            (20, 16, 20, 5, 20, 10, 9.5, 10, 9.5, 10, 1.0),
+        )
 
 
 if __name__ == "__main__":
@@ -1,8 +1,27 @@
+import os
 import unittest
 
 import zool
 
 
+def _make_vstack(padding=0.1, **kwargs):
+    """Vertical stack layout, 10 wide with 0.5 margins, shared by the tests.
+
+    Other keyword arguments, e.g., figheight, are passed to the Layout; if
+    figheight is omitted then it defaults to from children.
+    """
+    return zool.Layout(
+        figwidth=10.0,
+        layout="vertical",
+        padding=padding,
+        margin_left=0.5,
+        margin_right=0.5,
+        margin_top=0.5,
+        margin_bottom=0.5,
+        **kwargs,
+    )
+
+
 class TestPlotElement(unittest.TestCase):
     def test_base_layout(self):
         """Test the base size is correct without any child items."""
@@ -35,15 +54,7 @@ class TestPlotElement(unittest.TestCase):
 
     def test_simple_vertical_stack(self):
         """Check that we can construct a simple vertical stack"""
-        layout = zool.Layout(
-            figwidth=10.0,
-            layout="vertical",
-            padding=0.1,
-            margin_left=0.5,
-            margin_right=0.5,
-            margin_top=0.5,
-            margin_bottom=0.5,
-        )  # omitting figheight means it defaults to from children
+        layout = _make_vstack()
         layout["a"] = zool.PlotElement(height=4.0)
         layout["b"] = zool.PlotElement(height=4.0)
         layout["c"] = zool.PlotElement(height=4.0)
@@ -62,15 +73,7 @@ class TestPlotElement(unittest.TestCase):
 
     def test_simple_vertical_stack_with_named(self):
         """Test vertical stack where height of one panel is from another."""
-        layout = zool.Layout(
-            figwidth=10.0,
-            layout="vertical",
-            padding=0.1,
-            margin_left=0.5,
-            margin_right=0.5,
-            margin_top=0.5,
-            margin_bottom=0.5,
-        )  # omitting figheight means it defaults to from children
+        layout = _make_vstack()
         layout["a"] = zool.PlotElement(height=4.0)
         layout["b"] = zool.PlotElement(height=zool.Named("d"))
         layout["c"] = zool.PlotElement(height=4.0)
@@ -92,15 +95,7 @@ class TestPlotElement(unittest.TestCase):
 
     def test_simple_vertical_stack_with_split(self):
         """Test a vertical stack with one element split vertically in two."""
-        layout = zool.Layout(
-            figwidth=10.0,
-            layout="vertical",
-            padding=0.1,
-            margin_left=0.5,
-            margin_right=0.5,
-            margin_top=0.5,
-            margin_bottom=0.5,
-        )  # omitting figheight means it defaults to from children
+        layout = _make_vstack()
         layout["a"] = zool.PlotElement(height=4.0)
         layout["b"] = zool.PlotElement(height=4.0)
         layout["c"] = zool.PlotElement(
@@ -126,16 +121,7 @@ class TestPlotElement(unittest.TestCase):
 
     def test_simple_vertical_stack_filled(self):
         """Construct a vertical stack using filling of the available space."""
-        layout = zool.Layout(
-            figwidth=10.0,
-            figheight=17.0,
-            layout="vertical",
-            padding=0.25,
-            margin_left=0.5,
-            margin_right=0.5,
-            margin_top=0.5,
-            margin_bottom=0.5,
-        )  # omitting figheight means it defaults to from children
+        layout = _make_vstack(figheight=17.0, padding=0.25)
         layout["a"] = zool.PlotElement(height=zool.Fill())
         layout["b"] = zool.PlotElement(height=zool.Fill())
         layout["c"] = zool.PlotElement(height=zool.Fill())
@@ -158,15 +144,7 @@ class TestPlotElement(unittest.TestCase):
 
     def test_simple_vertical_stack_fixedaspect(self):
         """Test a simple vertical stack using a fixed aspect ratio."""
-        layout = zool.Layout(
-            figwidth=10.0,
-            layout="vertical",
-            padding=0.25,
-            margin_left=0.5,
-            margin_right=0.5,
-            margin_top=0.5,
-            margin_bottom=0.5,
-        )  # omitting figheight means it defaults to from children
+        layout = _make_vstack(padding=0.25)
         layout["a"] = zool.PlotElement(height=zool.FixedAspect(2))
         layout["b"] = zool.PlotElement(height=zool.FixedAspect(2))
         layout["c"] = zool.PlotElement(height=zool.FixedAspect(2))
@@ -188,6 +166,17 @@ class TestPlotElement(unittest.TestCase):
         self.assertAlmostEqual(layout["d"].height.value(), 4.5)
         self.assertAlmostEqual(layout["base"].height.value(), 19.75)
 
+    def test_horizontal_stack_fixedaspect_width(self):
+        """Test a horizontal stack where a panel width has a fixed aspect."""
+        layout = zool.Layout(figheight=4.0, layout="horizontal")
+        layout["a"] = zool.PlotElement(width=zool.FixedAspect(2))
+        layout["b"] = zool.PlotElement(width=3.0)
+        layout.layout()
+
+        self.assertAlmostEqual(layout["a"].height.value(), 4)
+        self.assertAlmostEqual(layout["a"].width.value(), 8)
+        self.assertAlmostEqual(layout["base"].width.value(), 11)
+
     def test_stack_with_horizontal_panel(self):
         """Test a vertical stack including a horizontal split panel."""
         layout = zool.Layout(
@@ -218,7 +207,8 @@ class TestPlotElement(unittest.TestCase):
         # print(layout.solver.dumps())
         # for id in layout._elements:
         #     print(id,layout[id].width.value())
-        layout.preview()
+        if os.environ.get("ZOOL_PREVIEW"):
+            layout.preview()
         self.assertAlmostEqual(layout["one"].height.value(), 2)
         self.assertAlmostEqual(layout["two"].height.value(), 2)
         self.assertAlmostEqual(layout["three"].height.value(), 3)
@@ -231,6 +221,87 @@ class TestPlotElement(unittest.TestCase):
         self.assertAlmostEqual(layout["five"].height.value(), 3)
         self.assertAlmostEqual(layout["five"].width.value(), 3.5)
 
+    def test_relayout_after_adding(self):
+        """Check a layout solved again after adding elements is correct"""
+        layout = zool.Layout(figwidth=10.0, figheight=6.0, layout="vertical")
+        layout["one"] = zool.PlotElement(height=zool.Fill())
+        layout["two"] = zool.PlotElement(
+            height=2.0, layout="horizontal", padding=1.0
+        )
+        layout["two", "a"] = zool.PlotElement(width=zool.Fill())
+        layout.layout()
+        self.assertAlmostEqual(layout["one"].height.value(), 4.0)
+        self.assertAlmostEqual(layout["a"].width.value(), 10.0)
+
+        layout["three"] = zool.PlotElement(height=zool.Fill())
+        layout["two", "b"] = zool.PlotElement(width=zool.Fill())
+        layout.layout()
+        self.assertAlmostEqual(layout["one"].height.value(), 2.0)
+        self.assertAlmostEqual(layout["three"].height.value(), 2.0)
+        self.assertAlmostEqual(layout["three"].y_bottom, 0.0)
+        self.assertAlmostEqual(layout["a"].width.value(), 4.5)
+        self.assertAlmostEqual(layout["b"].width.value(), 4.5)
+        self.assertAlmostEqual(layout["b"].x_left, 5.5)
+
+    def test_relayout_after_replacing_base(self):
+        """Check the base size is rebuilt if the base element is replaced"""
+        layout = zool.Layout(figwidth=10.0, figheight=4.0)
+        layout["a"] = zool.PlotElement(height=zool.Fill())
+        layout.layout()
+        self.assertAlmostEqual(layout["a"].width.value(), 10.0)
+
+        base = zool.PlotElement(id="base", width=20.0, height=4.0)
+        base.append_child("a")
+        layout._elements["base"] = base
+        layout._solved = False
+        layout.layout()
+        self.assertAlmostEqual(layout["base"].width.value(), 20.0)
+        self.assertAlmostEqual(layout["a"].width.value(), 20.0)
+
+    def test_deeply_nested(self):
+        """Check a nesting deeper than the recursion limit can be solved"""
+        layout = zool.Layout(figwidth=10.0)
+        parent = "base"
+        for i in range(2000):
+            layout[parent, str(i)] = zool.PlotElement(
+                height=zool.FromChildren()
+            )
+            parent = str(i)
+        layout[parent, "leaf"] = zool.PlotElement(height=2.0)
+        layout.layout()
+        self.assertAlmostEqual(layout["base"].height.value(), 2.0)
+        self.assertAlmostEqual(layout["leaf"].width.value(), 10.0)
+        self.assertAlmostEqual(layout["leaf"].y_bottom, 0.0)
+
+    def test_constraint_subclasses(self):
+        """Check subclasses of the constraints are handled as their base"""
+
+        class MyFixed(zool.Fixed):
+            pass
+
+        class MyFill(zool.Fill):
+            pass
+
+        layout = zool.Layout(figwidth=10.0, figheight=5.0)
+        layout["a"] = zool.PlotElement(height=MyFixed(3.0))
+        layout["b"] = zool.PlotElement(height=MyFill())
+        layout.layout()
+        self.assertAlmostEqual(layout["a"].height.value(), 3.0)
+        self.assertAlmostEqual(layout["b"].height.value(), 2.0)
+
+        class MyNamed(zool.Named):
+            pass
+
+        class MyFixedAspect(zool.FixedAspect):
+            pass
+
+        layout = zool.Layout(figwidth=10.0, layout="vertical")
+        layout["a"] = zool.PlotElement(height=MyFixedAspect(5.0))
+        layout["b"] = zool.PlotElement(height=MyNamed("a"))
+        layout.layout()
+        self.assertAlmostEqual(layout["b"].height.value(), 2.0)
+        self.assertAlmostEqual(layout["base"].height.value(), 4.0)
+
 
 if __name__ == "__main__":
     unittest.main()
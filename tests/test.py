@@ -2,7 +2,10 @@
 
 import unittest
 
+import numpy as np
+
 import zool
+from zool.exceptions import UserError
 
 
 class TestFactory(unittest.TestCase):
@@ -14,18 +17,55 @@ class TestFactory(unittest.TestCase):
             margin_right=2.0,
             margin_top=2.0,
             margin_bottom=2,
-            w=20,
+            figwidth=24,
+        )
+        self.assertAlmostEqual(tmp["base"].width.value(), 24)
+        self.assertAlmostEqual(tmp["base"].height.value(), 40)
+        self.assertAlmostEqual(tmp["3"].y_bottom, 2)
+        self.assertAlmostEqual(tmp["3"].y_top, 2 + 10)
+        self.assertAlmostEqual(tmp["2"].y_bottom, 2 + 10 + 2)
+        self.assertAlmostEqual(tmp["2"].y_top, 2 + 10 + 2 + 10)
+        self.assertAlmostEqual(tmp["1"].y_bottom, 2 + 10 + 2 + 10 + 2)
+        self.assertAlmostEqual(tmp["1"].y_top, 2 + 10 + 2 + 10 + 2 + 5)
+        self.assertAlmostEqual(tmp["0"].y_bottom, 2 + 10 + 2 + 10 + 2 + 5 + 2)
+        self.assertAlmostEqual(tmp["0"].y_top, 2 + 10 + 2 + 10 + 2 + 5 + 2 + 5)
+
+    def test_numpy_labels(self):
+        tmp = zool.vertical_stack(
+            [2.0, 3.0], labels=np.array(["top", "bottom"]), figwidth=10.0
         )
-        self.assertEqual(tmp.figure_width, 24)
-        self.assertEqual(tmp.figure_height, 40)
-        self.assertEqual(tmp["3"].yb, 2)
-        self.assertEqual(tmp["3"].yt, 2 + 10)
-        self.assertEqual(tmp["2"].yb, 2 + 10 + 2)
-        self.assertEqual(tmp["2"].yt, 2 + 10 + 2 + 10)
-        self.assertEqual(tmp["1"].yb, 2 + 10 + 2 + 10 + 2)
-        self.assertEqual(tmp["1"].yt, 2 + 10 + 2 + 10 + 2 + 5)
-        self.assertEqual(tmp["0"].yb, 2 + 10 + 2 + 10 + 2 + 5 + 2)
-        self.assertEqual(tmp["0"].yt, 2 + 10 + 2 + 10 + 2 + 5 + 2 + 5)
+        self.assertAlmostEqual(tmp["top"].height.value(), 2.0)
+        self.assertAlmostEqual(tmp["bottom"].y_top, 3.0)
+        self.assertIs(type(tmp["top"].id), str)
+
+    def test_triangle(self):
+        tmp = zool.triangle(["a", "b", "c"], d2d=4.0, d1d=1.0, t_padding=0.5)
+        self.assertAlmostEqual(tmp["base"].height.value(), 1 + 2 * 4.5)
+        self.assertAlmostEqual(tmp["t2-frame"].height.value(), 1 + 2 * 4.5)
+        self.assertAlmostEqual(tmp["a-c-2d"].y_bottom, 4.5)
+        self.assertAlmostEqual(tmp["a-b-2d"].y_bottom, 0)
+
+    def test_triangle_arguments(self):
+        with self.assertRaises(UserError):
+            zool.triangle(["a"])
+        with self.assertRaises(UserError):
+            zool.triangle_equal(["a"], 20.0)
+        with self.assertRaises(UserError):
+            zool.triangle_equal(["a", "b"], zool.FromChildren())
+        with self.assertRaises(UserError):
+            zool.triangle_equal(["a", "b"], zool.FixedAspect(1.0))
+
+    def test_subplot(self):
+        tmp = zool.subplot(2, 3, 20, fixed_height=10, padding=1)
+        self.assertAlmostEqual(tmp["r02c03"].width.value(), 6)
+        self.assertAlmostEqual(tmp["r02c03"].height.value(), 4.5)
+        self.assertAlmostEqual(tmp["r02c03"].x_left, 14)
+
+    def test_subplot_arguments(self):
+        with self.assertRaises(UserError):
+            zool.subplot(2, 3, 20)
+        with self.assertRaises(UserError):
+            zool.subplot(2, 3, 20, fixed_height=10, fixed_aspect=1.0)
 
 
 if __name__ == "__main__":